@@ -9,6 +9,10 @@ import warnings
 import copy
 import os
 import logging
+import functools
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from astropy.table import Table
@@ -17,6 +21,14 @@ from astropy.units import Quantity
 
 from stingray.utils import sqsum
 from .io import _can_save_longdouble, _can_serialize_meta
+from .gti import (
+    check_gtis,
+    create_gti_mask,
+    cross_two_gtis,
+    get_btis,
+    gti_border_bins,
+    merge_gtis,
+)
 
 from typing import TYPE_CHECKING, Type, TypeVar, Union
 
@@ -40,17 +52,337 @@ __all__ = [
 ]
 
 
-def convert_table_attrs_to_lowercase(table: Table) -> Table:
-    """Convert the column names of an Astropy Table to lowercase."""
-    new_table = Table()
-    for col in table.colnames:
-        new_table[col.lower()] = table[col]
-    for key in table.meta.keys():
-        new_table.meta[key.lower()] = table.meta[key]
+def convert_table_attrs_to_lowercase(table: Table, copy: bool = True) -> Table:
+    """Convert the column names of an Astropy Table to lowercase.
+
+    Parameters
+    ----------
+    table : :class:`astropy.table.Table`
+        The input table
+
+    Other parameters
+    ----------------
+    copy : bool, default True
+        If False, the columns of the new table share their data with the input table.
+    """
+    new_table = Table(
+        {col.lower(): table[col] for col in table.colnames},
+        meta={key.lower(): val for key, val in table.meta.items()},
+        copy=copy,
+    )
 
     return new_table
 
 
+def _is_uncompressed_fits(filename: str, fmt: str = None) -> bool:
+    """Check if a file is an uncompressed FITS file, that can be memory-mapped.
+
+    If ``fmt`` is None, the format is guessed from the file extension.
+    """
+    filename = str(filename).lower()
+    if filename.endswith((".gz", ".bz2", ".z", ".zip", ".xz")):
+        return False
+    if fmt is None:
+        return filename.endswith((".fits", ".fit", ".fts"))
+    return fmt.lower() == "fits"
+
+
+# Attributes used internally by StingrayObject, never pointing to data
+_NOT_DATA_ATTRS = ["main_array_attr", "not_array_attr", "_attr_cache", "_stingray_class_attrs"]
+
+
+def _cached_attr_list(method):
+    """Memoize a method returning a list of attribute names, per instance.
+
+    The result is stored in the ``_attr_cache`` slot of the instance, which is
+    discarded by :meth:`StingrayObject.__setattr__` every time an assignment can change
+    the classification of the attributes.
+    A copy of the list is returned, so that callers can modify it freely.
+    """
+    key = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = getattr(self, "_attr_cache", None)
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_attr_cache", cache)
+        if key not in cache:
+            cache[key] = method(self)
+        return list(cache[key])
+
+    return wrapper
+
+
+def _has_object_dtype(value) -> bool:
+    """Check if a value would be converted by Numpy into an array of objects.
+
+    Avoids the creation of a new array for the most common types.
+    """
+    if isinstance(value, np.ndarray):
+        return value.dtype == "O"
+    if value is None:
+        return True
+    if isinstance(value, (bool, float, complex, str, bytes)):
+        return False
+    if isinstance(value, int):
+        # Integers too large for 64 bits can only be stored as objects
+        return not (-(2**63) <= value < 2**64)
+    return np.asarray(value).dtype == "O"
+
+
+def _is_scalar(value) -> bool:
+    """Check if a value is a scalar (including 0-d arrays), without calling ``np.isscalar``."""
+    if isinstance(value, (int, float, complex, str, bytes, np.generic)):
+        return True
+    return np.ndim(value) == 0
+
+
+def _concatenate_in_order(arrays, order, scratch):
+    """Concatenate arrays along the first axis, then reorder the result.
+
+    The concatenated values are only needed until they are reordered, so they are written
+    into buffers from the ``scratch`` dictionary, reused across calls, instead of a new
+    array each time.
+    """
+    if isinstance(order, slice):
+        return np.concatenate(arrays)[order]
+    arrays = [np.asarray(array) for array in arrays]
+    dtype = np.result_type(*arrays)
+    shape = (sum(array.shape[0] for array in arrays),) + arrays[0].shape[1:]
+    buffer = scratch.get((dtype, shape))
+    if buffer is None:
+        buffer = scratch[(dtype, shape)] = np.empty(shape, dtype=dtype)
+    np.concatenate(arrays, out=buffer)
+    return buffer[order]
+
+
+# Maximum number of threads concatenating array attributes in parallel, and minimum number
+# of attributes and of bytes to be concatenated for which threads are used
+_MAX_CONCATENATE_THREADS = min(8, os.cpu_count() or 1)
+_MIN_PARALLEL_ATTRS = 4
+_MIN_PARALLEL_BYTES = 4 * 1024**2
+
+
+def _concatenate_many_in_order(arrays_per_key, order, scratch):
+    """Apply :func:`_concatenate_in_order` to each list of arrays in a dictionary.
+
+    NumPy releases the GIL while copying data, so large jobs are spread over a pool of
+    threads, each with its own scratch buffers. Small jobs are done in the calling
+    thread, using ``scratch``.
+    """
+    nbytes = sum(getattr(a, "nbytes", 0) for arrays in arrays_per_key.values() for a in arrays)
+    if (
+        _MAX_CONCATENATE_THREADS < 2
+        or len(arrays_per_key) < _MIN_PARALLEL_ATTRS
+        or nbytes < _MIN_PARALLEL_BYTES
+    ):
+        return {
+            key: _concatenate_in_order(arrays, order, scratch)
+            for key, arrays in arrays_per_key.items()
+        }
+
+    local = threading.local()
+
+    def _concatenate(arrays):
+        if not hasattr(local, "scratch"):
+            local.scratch = {}
+        return _concatenate_in_order(arrays, order, local.scratch)
+
+    with ThreadPoolExecutor(max_workers=_MAX_CONCATENATE_THREADS) as pool:
+        return dict(zip(arrays_per_key, pool.map(_concatenate, arrays_per_key.values())))
+
+
+def _join_meta_values(a, b):
+    """Join two different values of a meta attribute of time series being joined.
+
+    Strings are joined with a comma, other values are collected in a tuple.
+
+    Examples
+    --------
+    >>> _join_meta_values("a", "b")
+    'a,b'
+    >>> _join_meta_values(_join_meta_values(1, 2), "b")
+    (1, 2, 'b')
+    """
+    if isinstance(a, str) and isinstance(b, str):
+        return a + "," + b
+    if isinstance(a, tuple):
+        return a + (b,)
+    return (a, b)
+
+
+def _is_dt_array(dt) -> bool:
+    """Check if ``dt`` holds one bin time per bin, rather than a single value.
+
+    The common scalar case is checked first, to avoid the slower instance check against
+    the ``Iterable`` abstract class.
+    """
+    if isinstance(dt, (int, float, np.generic)):
+        return False
+    if isinstance(dt, np.ndarray):
+        return dt.ndim > 0
+    return isinstance(dt, Iterable)
+
+
+def _is_double_scalar(value) -> bool:
+    """Check if a value is a floating point scalar that fits in a double without loss."""
+    return isinstance(value, (float, np.float64, np.float32, np.float16))
+
+
+# Maximum number of elements compared at once by _array_equal
+_ARRAY_EQUAL_CHUNK = 1 << 18
+
+
+def _array_equal(a, b) -> bool:
+    """Check if two array-like objects have the same shape and elements.
+
+    The cheap checks (identity, shape) are done first. NaNs in floating point or complex
+    arrays are considered equal when they are in the same positions.
+    """
+    if a is b:
+        return True
+    if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+        return np.array_equal(a, b)
+    if a.shape != b.shape:
+        return False
+    equal_nan = a.dtype.kind in "fc" and b.dtype.kind in "fc"
+    if a.size <= _ARRAY_EQUAL_CHUNK:
+        return np.array_equal(a, b, equal_nan=equal_nan)
+
+    # Compare large arrays in slices along the first axis, to avoid allocating a full-size
+    # boolean mask and to stop at the first slice that differs
+    step = max(1, _ARRAY_EQUAL_CHUNK // (a.size // a.shape[0]))
+    for start in range(0, a.shape[0], step):
+        stop = start + step
+        if not np.array_equal(a[start:stop], b[start:stop], equal_nan=equal_nan):
+            return False
+    return True
+
+
+def _attr_kind(value, main_length):
+    """Summarize all the properties of a value used to classify attributes.
+
+    Two values with the same kind always end up in the same attribute lists of a
+    :class:`StingrayObject` (data, array, internal array, meta attributes).
+    """
+    if isinstance(value, np.ndarray):
+        # Fast path for the most common case
+        if value.dtype == "O":
+            return None
+        if value.ndim > 0:
+            return (True, value.size == 0, value.shape[0] == main_length)
+    if callable(value) or isinstance(value, StingrayObject) or _has_object_dtype(value):
+        return None
+    if _is_scalar(value):
+        return (value is None, isinstance(value, str))
+    shape = np.shape(value)
+    is_listlike = isinstance(value, (np.ndarray, list, tuple)) or (
+        not isinstance(value, str) and isinstance(value, Iterable)
+    )
+    return (is_listlike, np.size(value) == 0, shape[0] == main_length)
+
+
+def _fast_copy(value, memo=None):
+    """Copy a value, unless it is immutable, in which case it is returned as it is.
+
+    ``memo`` is passed to ``copy.deepcopy``, to preserve shared references between the
+    values copied in the same operation.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, np.generic)):
+        return value
+    return copy.deepcopy(value, memo)
+
+
+def _masked_copy(array, mask):
+    """Apply a mask (or a slice, or an array of indices) to an array, returning a copy.
+
+    Boolean and fancy indexing already return a new array, so the data are only copied
+    again when the indexing returned a view (e.g. with slices).
+    """
+    array = np.asarray(array)
+    new_array = array[mask]
+    if np.may_share_memory(new_array, array):
+        new_array = new_array.copy()
+    return new_array
+
+
+def _mask_to_slice(mask):
+    """Return an equivalent slice if the ``True`` values of a boolean mask are contiguous.
+
+    Slicing copies a contiguous block of memory, which is considerably faster than
+    the gather needed by boolean indexing. If the mask has holes, it is returned unchanged.
+
+    Examples
+    --------
+    >>> _mask_to_slice(np.array([False, True, True, False]))
+    slice(1, 3, None)
+    >>> _mask_to_slice(np.array([True, False, True]))
+    array([ True, False,  True])
+    >>> _mask_to_slice(np.array([False, False]))
+    slice(0, 0, None)
+    """
+    mask = np.asarray(mask)
+    if mask.dtype != bool or mask.ndim != 1:
+        return mask
+    n_good = np.count_nonzero(mask)
+    if n_good == 0:
+        return slice(0, 0)
+    # argmax stops at the first True value
+    start = int(np.argmax(mask))
+    stop = mask.size - int(np.argmax(mask[::-1]))
+    if stop - start != n_good:
+        return mask
+    return slice(start, stop)
+
+
+# Minimum average length of the runs of good elements for which boolean indexing is
+# preferred to integer indices in _mask_to_index
+_MIN_MASK_RUN_LENGTH = 32
+
+
+def _mask_to_index(mask):
+    """Convert a 1-D boolean mask to the cheapest equivalent index for repeated use.
+
+    This is a slice if the good elements are contiguous, or the mask itself if they
+    come in long runs, which boolean indexing copies efficiently. Otherwise, the mask
+    is converted to integer indices, so that it is only scanned once however many
+    arrays are indexed with it.
+    """
+    index = _mask_to_slice(mask)
+    if isinstance(index, slice):
+        return index
+    n_runs = np.count_nonzero(mask[1:] & ~mask[:-1]) + int(mask[0])
+    if np.count_nonzero(mask) >= _MIN_MASK_RUN_LENGTH * n_runs:
+        return mask
+    return np.flatnonzero(mask)
+
+
+def _sort_order(values, reverse=False):
+    """Index sorting ``values``, which is a slice if they are already sorted.
+
+    Examples
+    --------
+    >>> _sort_order(np.array([1, 2, 2, 3]))
+    slice(None, None, None)
+    >>> _sort_order(np.array([1, 2, 3]), reverse=True)
+    slice(None, None, -1)
+    >>> _sort_order(np.array([2, 1, 3])).tolist()
+    [1, 0, 2]
+    >>> _sort_order(np.array([2, 1, 3]), reverse=True).tolist()
+    [2, 0, 1]
+    """
+    values = np.asarray(values)
+    # Time arrays are usually already sorted: no need to reorder anything
+    if np.all(values[1:] >= values[:-1]):
+        return slice(None, None, -1 if reverse else None)
+
+    order = np.argsort(values)
+    if reverse:
+        order = order[::-1]
+    return order
+
+
 class StingrayObject(object):
     """This base class defines some general-purpose utilities.
 
@@ -71,6 +403,10 @@ class StingrayObject(object):
     columns of the table/dataframe, otherwise as metadata.
     """
 
+    # The cache of attribute lists lives in a slot, outside of the instance dictionary.
+    # ``__dict__`` is kept, as all subclasses set arbitrary attributes.
+    __slots__ = ("_attr_cache", "__dict__", "__weakref__")
+
     not_array_attr: list = []
 
     def __init__(cls, *args, **kwargs) -> None:
@@ -79,12 +415,87 @@ class StingrayObject(object):
                 "A StingrayObject needs to have the main_array_attr attribute specified"
             )
 
+    def __setattr__(self, name, value):
+        # An assignment can change the classification of the attributes (array, meta, etc.),
+        # so the cached lists of attributes are discarded, unless the new value is of the
+        # same kind as the old one. The cache is private to each instance, and it is never
+        # copied from other objects.
+        cache = getattr(self, "_attr_cache", None)
+        object.__setattr__(self, "_attr_cache", None)
+        if name == "_attr_cache":
+            return
+
+        keep_cache = cache is not None and self._is_same_attr_kind(name, value)
+        super().__setattr__(name, value)
+        if keep_cache:
+            object.__setattr__(self, "_attr_cache", cache)
+
+    def __delattr__(self, name):
+        object.__setattr__(self, "_attr_cache", None)
+        if name != "_attr_cache":
+            super().__delattr__(name)
+
+    def _is_same_attr_kind(self, name, value) -> bool:
+        """Check if replacing an attribute with ``value`` leaves all attribute lists unchanged.
+
+        This is only verified for plain instance attributes that already exist, and that are
+        not the main array attribute. The attributes deciding how all others are classified
+        (e.g. ``not_array_attr``) are never considered unchanged.
+        """
+        if (
+            name in _NOT_DATA_ATTRS
+            or name not in self.__dict__
+            or name == self.main_array_attr
+            or name.startswith("__")
+            or name in (self.not_array_attr or [])
+            or name in self._class_attr_names()[1]
+        ):
+            return False
+        main_attr = getattr(self, self.main_array_attr, None)
+        if isinstance(main_attr, np.ndarray) and main_attr.ndim > 0:
+            main_length = main_attr.shape[0]
+        else:
+            main_length = self.main_array_length
+        return _attr_kind(self.__dict__[name], main_length) == _attr_kind(value, main_length)
+
+    def __getstate__(self):
+        # Only the instance dictionary is saved: the cache of attribute lists
+        # is never pickled or copied.
+        return self.__dict__
+
+    def _set_attrs(self, attrs: dict) -> None:
+        """Set many attributes at once.
+
+        Properties are set through their setters, in the order in which they appear in
+        ``attrs``; all other attributes are written directly into the instance dictionary,
+        with a single update.
+
+        Parameters
+        ----------
+        attrs : dict
+            Dictionary of attribute names and values
+        """
+        _, properties = self._class_attr_names()
+        plain_attrs = {}
+        for attr, value in attrs.items():
+            if attr in properties:
+                setattr(self, attr, value)
+            elif attr != "_attr_cache":
+                plain_attrs[attr] = value
+
+        object.__setattr__(self, "_attr_cache", None)
+        self.__dict__.update(plain_attrs)
+
     @property
     def main_array_length(self):
-        if getattr(self, self.main_array_attr, None) is None:
+        value = getattr(self, self.main_array_attr, None)
+        if value is None:
             return 0
-        return np.shape(np.asarray(getattr(self, self.main_array_attr)))[0]
+        if isinstance(value, np.ndarray):
+            return value.shape[0]
+        return np.shape(np.asarray(value))[0]
 
+    @_cached_attr_list
     def data_attributes(self) -> list[str]:
         """Clean up the list of attributes, only giving out those pointing to data.
 
@@ -100,19 +511,58 @@ class StingrayObject(object):
             List of attributes pointing to data that are not methods, properties,
             or other ``StingrayObject`` instances.
         """
+        class_attrs, properties = self._class_attr_names()
+        all_attrs = class_attrs.union(self.__dict__).difference(properties)
         return [
             attr
-            for attr in dir(self)
+            for attr in sorted(all_attrs)
             if (
                 not attr.startswith("__")
-                and attr not in ["main_array_attr", "not_array_attr"]
-                and not isinstance(getattr(self.__class__, attr, None), property)
+                and attr not in _NOT_DATA_ATTRS
                 and not callable(value := getattr(self, attr))
                 and not isinstance(value, StingrayObject)
-                and not np.asarray(value).dtype == "O"
+                and not _has_object_dtype(value)
             )
         ]
 
+    @classmethod
+    def _class_attr_names(cls) -> tuple[frozenset[str], frozenset[str]]:
+        """List the class attributes that might point to data, and the properties of the class.
+
+        These only depend on the class, so they are calculated once and stored in the class
+        itself. Methods, and other callable class attributes, are excluded from the first set:
+        they will only be considered if shadowed by an instance attribute.
+
+        Returns
+        -------
+        class_attrs : frozenset of str
+            Names of the non-callable class attributes, excluding properties and dunders.
+        properties : frozenset of str
+            Names of the properties of the class.
+        """
+        if "_stingray_class_attrs" not in cls.__dict__:
+            all_names = set()
+            for klass in cls.__mro__:
+                all_names.update(vars(klass))
+
+            class_attrs = set()
+            properties = set()
+            for name in all_names:
+                if name.startswith("__") or name in _NOT_DATA_ATTRS:
+                    continue
+                value = getattr(cls, name, None)
+                if isinstance(value, types.MemberDescriptorType):
+                    # Slots are only used for internal bookkeeping
+                    continue
+                if isinstance(value, property):
+                    properties.add(name)
+                elif not callable(value):
+                    class_attrs.add(name)
+            cls._stingray_class_attrs = (frozenset(class_attrs), frozenset(properties))
+
+        return cls._stingray_class_attrs
+
+    @_cached_attr_list
     def array_attrs(self) -> list[str]:
         """List the names of the array attributes of the Stingray Object.
 
@@ -129,19 +579,27 @@ class StingrayObject(object):
         if main_attr is None:
             return []
 
-        return [
-            attr
-            for attr in self.data_attributes()
-            if (
-                not attr.startswith("_")
-                and not attr == self.main_array_attr
-                and isinstance(getattr(self, attr), Iterable)
-                and attr not in self.not_array_attr
-                and not isinstance(getattr(self, attr), str)
-                and np.shape(getattr(self, attr))[0] == np.shape(main_attr)[0]
-            )
-        ]
+        # Invariants of the loop below
+        main_attr_length = np.shape(main_attr)[0]
+        not_array_attr = self.not_array_attr
+
+        all_attrs = []
+        for attr in self.data_attributes():
+            if attr.startswith("_") or attr == self.main_array_attr or attr in not_array_attr:
+                continue
+            value = getattr(self, attr)
+            # Cheap check for the most common types, before the more expensive ABC one
+            if not isinstance(value, (np.ndarray, list, tuple)) and (
+                isinstance(value, str) or not isinstance(value, Iterable)
+            ):
+                continue
+            shape = np.shape(value)
+            if len(shape) > 0 and shape[0] == main_attr_length:
+                all_attrs.append(attr)
+
+        return all_attrs
 
+    @_cached_attr_list
     def internal_array_attrs(self) -> list[str]:
         """List the names of the internal array attributes of the Stingray Object.
 
@@ -162,21 +620,26 @@ class StingrayObject(object):
         if main_attr_value is None:
             return []
 
+        # Invariants of the loop below
+        main_attr_length = np.shape(main_attr_value)[0]
+        forbidden_attrs = {"_" + main_attr}  # e.g. _time in lightcurve
+        forbidden_attrs.update("_" + a for a in self.not_array_attr)
+
         all_attrs = []
         for attr in self.data_attributes():
             if (
-                not attr == "_" + self.main_array_attr  # e.g. _time in lightcurve
-                and attr not in ["_" + a for a in self.not_array_attr]
-                and not np.isscalar(value := getattr(self, attr))
-                and value is not None
+                attr.startswith("_")
+                and attr not in forbidden_attrs
+                and (value := getattr(self, attr)) is not None
+                and not _is_scalar(value)
                 and not np.size(value) == 0
-                and attr.startswith("_")
-                and np.shape(value)[0] == np.shape(main_attr_value)[0]
+                and np.shape(value)[0] == main_attr_length
             ):
                 all_attrs.append(attr)
 
         return all_attrs
 
+    @_cached_attr_list
     def meta_attrs(self) -> list[str]:
         """List the names of the meta attributes of the Stingray Object.
 
@@ -289,32 +752,52 @@ class StingrayObject(object):
         if not set(self_meta_attrs) == set(other_meta_attrs):
             return False
 
-        for attr in self.meta_attrs():
+        # Floating point scalars (e.g. ``mjdref``, ``dt``) are collected and compared
+        # all at once at the end, in a single vectorized call
+        self_floats = []
+        other_floats = []
+        for attr in self_meta_attrs:
+            self_val = getattr(self, attr, None)
+            other_val = getattr(other_ts, attr, None)
+            if self_val is other_val:
+                continue
+
+            if _is_double_scalar(self_val) and _is_double_scalar(other_val):
+                self_floats.append(self_val)
+                other_floats.append(other_val)
+                continue
+
             # They are either both scalar or arrays
-            if np.isscalar(getattr(self, attr)) != np.isscalar(getattr(other_ts, attr)):
+            self_is_scalar = _is_scalar(self_val)
+            if self_is_scalar != _is_scalar(other_val):
                 return False
 
-            if np.isscalar(getattr(self, attr)):
-                if not getattr(self, attr, None) == getattr(other_ts, attr, None):
+            if self_is_scalar:
+                if not self_val == other_val:
                     return False
             else:
-                if not np.array_equal(getattr(self, attr, None), getattr(other_ts, attr, None)):
+                if not _array_equal(self_val, other_val):
                     return False
 
-        for attr in self.array_attrs():
-            if not np.array_equal(getattr(self, attr), getattr(other_ts, attr)):
+        if len(self_floats) > 0:
+            n_floats = len(self_floats)
+            self_floats = np.fromiter(self_floats, dtype=np.float64, count=n_floats)
+            other_floats = np.fromiter(other_floats, dtype=np.float64, count=n_floats)
+            if not np.array_equal(self_floats, other_floats, equal_nan=True):
                 return False
 
-        for attr in self.internal_array_attrs():
-            if not np.array_equal(getattr(self, attr), getattr(other_ts, attr)):
+        for attr in self_arr_attrs + self.internal_array_attrs():
+            if not _array_equal(getattr(self, attr), getattr(other_ts, attr)):
                 return False
 
         return True
 
+    @_cached_attr_list
     def _default_operated_attrs(self):
         operated_attrs = [attr for attr in self.array_attrs() if not attr.endswith("_err")]
         return operated_attrs
 
+    @_cached_attr_list
     def _default_error_attrs(self):
         return [attr for attr in self.array_attrs() if attr.endswith("_err")]
 
@@ -342,6 +825,11 @@ class StingrayObject(object):
             This needs to be done in some cases, e.g. when the table is to be saved
             in an architecture not supporting extended precision (e.g. ARM), but can
             also be useful when an extended precision is not needed.
+
+        Notes
+        -----
+        The array data are not copied: the columns of the table share memory with the array
+        attributes of the object (unless their precision is reduced).
         """
         data = {}
         array_attrs = self.array_attrs() + [self.main_array_attr] + self.internal_array_attrs()
@@ -352,17 +840,17 @@ class StingrayObject(object):
                 vals = reduce_precision_if_extended(vals)
             data[attr] = vals
 
-        ts = Table(data)
+        ts = Table(data, copy=False)
         meta_dict = self.get_meta_dict()
         for attr in meta_dict.keys():
             if no_longdouble:
                 meta_dict[attr] = reduce_precision_if_extended(meta_dict[attr])
             value = meta_dict[attr]
-            rep = repr(value)
             # Work around issue with Numpy 2.0 and Yaml serializer.
-            if "np.float" in rep:
+            # Extended precision values are kept, as they would lose precision as floats
+            if isinstance(value, (np.float16, np.float32, np.float64)):
                 value = float(value)
-            elif "np.int" in rep:
+            elif isinstance(value, np.signedinteger):
                 value = int(value)
             meta_dict[attr] = value
         ts.meta.update(meta_dict)
@@ -395,13 +883,16 @@ class StingrayObject(object):
                 setattr(cls, cls.main_array_attr, mainarray)  # type: ignore
                 break
 
+        new_attrs = {}
         for attr in array_attrs:
             if attr.lower() == cls.main_array_attr:  # type: ignore
                 continue
-            setattr(cls, attr.lower(), np.array(ts[attr]))
+            new_attrs[attr.lower()] = np.array(ts[attr])
 
         for key, val in ts.meta.items():
-            setattr(cls, key.lower(), val)
+            new_attrs[key.lower()] = val
+
+        cls._set_attrs(new_attrs)
 
         return cls
 
@@ -451,16 +942,19 @@ class StingrayObject(object):
         setattr(cls, cls.main_array_attr, mainarray)  # type: ignore
 
         all_array_attrs = []
+        new_attrs = {}
         for array_attrs in [ts.coords, ts.data_vars]:
             for attr in array_attrs:
                 all_array_attrs.append(attr)
                 if attr == cls.main_array_attr:  # type: ignore
                     continue
-                setattr(cls, attr, np.array(ts[attr]))
+                new_attrs[attr] = np.array(ts[attr])
 
         for key, val in ts.attrs.items():
             if key not in all_array_attrs:
-                setattr(cls, key, val)
+                new_attrs[key] = val
+
+        cls._set_attrs(new_attrs)
 
         return cls
 
@@ -476,23 +970,27 @@ class StingrayObject(object):
 
         See documentation of `make_nd_into_arrays` for details.
 
+        The data of one-dimensional arrays are not copied, if possible.
+
         """
         from pandas import DataFrame
-        from .utils import make_nd_into_arrays
 
-        data = {}
         array_attrs = self.array_attrs() + [self.main_array_attr] + self.internal_array_attrs()
+        data = {attr: np.asarray(getattr(self, attr)) for attr in array_attrs}
 
-        for attr in array_attrs:
-            values = np.asarray(getattr(self, attr))
-            ndim = len(np.shape(values))
-            if ndim > 1:
-                local_data = make_nd_into_arrays(values, attr)
-            else:
-                local_data = {attr: values}
-            data.update(local_data)
+        # Only split the multi-dimensional arrays, if there are any
+        if any(values.ndim > 1 for values in data.values()):
+            from .utils import make_nd_into_arrays
 
-        ts = DataFrame(data)
+            nd_data = data
+            data = {}
+            for attr, values in nd_data.items():
+                if values.ndim > 1:
+                    data.update(make_nd_into_arrays(values, attr))
+                else:
+                    data[attr] = values
+
+        ts = DataFrame(data, copy=False)
 
         ts.attrs.update(self.get_meta_dict())
 
@@ -530,20 +1028,23 @@ class StingrayObject(object):
         setattr(cls, cls.main_array_attr, mainarray)  # type: ignore
 
         nd_attrs = []
+        new_attrs = {}
         for attr in array_attrs:
             if attr == cls.main_array_attr:  # type: ignore
                 continue
             if "_dim" in attr:
                 nd_attrs.append(re.sub("_dim[0-9].*", "", attr))
             else:
-                setattr(cls, attr, np.array(ts[attr]))
+                new_attrs[attr] = np.array(ts[attr])
 
         for attr in list(set(nd_attrs)):
-            setattr(cls, attr, make_1d_arrays_into_nd(ts, attr))
+            new_attrs[attr] = make_1d_arrays_into_nd(ts, attr)
 
         for key, val in ts.attrs.items():
             if key not in array_attrs:
-                setattr(cls, key, val)
+                new_attrs[key] = val
+
+        cls._set_attrs(new_attrs)
 
         return cls
 
@@ -596,34 +1097,53 @@ class StingrayObject(object):
         elif fmt.lower() == "ascii":
             fmt = "ascii.ecsv"
 
-        ts = convert_table_attrs_to_lowercase(Table.read(filename, format=fmt))
+        # FITS files are memory-mapped, so that the data are only loaded from disk when
+        # they get copied into the new object, instead of being read in memory first.
+        read_kwargs = {}
+        if _is_uncompressed_fits(filename, fmt):
+            read_kwargs["memmap"] = True
+        ts = convert_table_attrs_to_lowercase(
+            Table.read(filename, format=fmt, **read_kwargs), copy=False
+        )
 
         # For specific formats, and in any case when the format is not
         # specified, make sure that complex values are treated correctly.
         if fmt is None or "ascii" in fmt:
+            # Group the real and imaginary parts by column name
+            complex_parts = {}
             for col in ts.colnames:
-                if not ((is_real := col.endswith(".real")) or (is_imag := col.endswith(".imag"))):
-                    continue
-
-                new_value = ts[col]
-
-                if is_imag:
-                    new_value = new_value * 1j
-
-                # Make sure it's complex, even if we find the real part first
-                new_value = new_value + 0.0j
-
-                col_strip = col.replace(".real", "").replace(".imag", "")
-
-                if col_strip not in ts.colnames:
-                    # If the column without ".real" or ".imag" doesn't exist,
-                    # define it, and make sure it's complex-valued
-                    ts[col_strip] = new_value
-                else:
-                    # If it does exist, sum the new value to it.
-                    ts[col_strip] += new_value
-
-                ts.remove_column(col)
+                col_strip, _, part = col.rpartition(".")
+                if col_strip != "" and part in ["real", "imag"]:
+                    complex_parts.setdefault(col_strip, {})[part] = ts[col]
+
+            # Build the new table in one go, instead of adding and removing columns one by one
+            if len(complex_parts) > 0:
+                new_cols = {}
+                for col in ts.colnames:
+                    col_strip, _, part = col.rpartition(".")
+                    if part not in ["real", "imag"] or col_strip not in complex_parts:
+                        col_strip = col
+                    if col_strip in new_cols:
+                        continue
+                    if col_strip not in complex_parts:
+                        new_cols[col] = ts[col]
+                        continue
+
+                    parts = complex_parts[col_strip]
+                    shape = ts[col].shape
+                    dtype = np.result_type(np.complex64, *[p.dtype for p in parts.values()])
+                    # Make sure it's complex, even if there is only the real part
+                    new_value = np.zeros(shape, dtype=dtype)
+                    if "real" in parts:
+                        new_value.real = parts["real"]
+                    if "imag" in parts:
+                        new_value.imag = parts["imag"]
+                    if col_strip in ts.colnames:
+                        # If the column without ".real" or ".imag" exists, sum it
+                        new_value += ts[col_strip]
+                    new_cols[col_strip] = new_value
+
+                ts = Table(new_cols, meta=ts.meta, copy=False)
 
         return cls.from_astropy_table(ts)
 
@@ -657,7 +1177,8 @@ class StingrayObject(object):
             pass
         elif fmt.lower() == "pickle":
             with open(filename, "wb") as fobj:
-                pickle.dump(self, fobj)
+                # Protocol 5 (Python 3.8+) writes large Numpy arrays with less overhead
+                pickle.dump(self, fobj, protocol=pickle.HIGHEST_PROTOCOL)
             return
         elif fmt.lower() == "ascii":
             fmt = "ascii.ecsv"
@@ -672,11 +1193,18 @@ class StingrayObject(object):
         ts = to_be_saved.to_astropy_table(no_longdouble=not CAN_SAVE_LONGD)
 
         if fmt is None or "ascii" in fmt:
-            for col in ts.colnames:
-                if np.iscomplex(ts[col].flatten()[0]):
-                    ts[f"{col}.real"] = ts[col].real
-                    ts[f"{col}.imag"] = ts[col].imag
-                    ts.remove_column(col)
+            # Check the dtype, not the values: a complex column can have zero imaginary parts
+            complex_cols = [col for col in ts.colnames if ts[col].dtype.kind == "c"]
+            # Build the new table in one go, instead of adding and removing columns one by one
+            if len(complex_cols) > 0:
+                new_cols = {}
+                for col in ts.colnames:
+                    if col in complex_cols:
+                        new_cols[f"{col}.real"] = ts[col].real
+                        new_cols[f"{col}.imag"] = ts[col].imag
+                    else:
+                        new_cols[col] = ts[col]
+                ts = Table(new_cols, meta=ts.meta, copy=False)
 
         if CAN_SERIALIZE_META:
             ts.write(filename, format=fmt, overwrite=True, serialize_meta=True)
@@ -710,12 +1238,21 @@ class StingrayObject(object):
         if filtered_attrs is None:
             filtered_attrs = all_attrs
 
+        main_array = getattr(self, self.main_array_attr)
+        if (
+            isinstance(mask, np.ndarray)
+            and mask.dtype == bool
+            and mask.ndim == 1
+            and mask.size == np.size(main_array)
+        ):
+            mask = _mask_to_index(mask)
+
         if inplace:
             new_ts = self
         else:
             new_ts = type(self)()
             for attr in self.meta_attrs():
-                setattr(new_ts, attr, copy.deepcopy(getattr(self, attr)))
+                setattr(new_ts, attr, _fast_copy(getattr(self, attr)))
 
         # If the main array attr is managed through an internal attr
         # (e.g. lightcurve), set the internal attr instead.
@@ -723,21 +1260,17 @@ class StingrayObject(object):
             setattr(
                 new_ts,
                 "_" + self.main_array_attr,
-                copy.deepcopy(np.asarray(getattr(self, self.main_array_attr))[mask]),
+                _masked_copy(main_array, mask),
             )
         else:
-            setattr(
-                new_ts,
-                self.main_array_attr,
-                copy.deepcopy(np.asarray(getattr(self, self.main_array_attr))[mask]),
-            )
+            setattr(new_ts, self.main_array_attr, _masked_copy(main_array, mask))
 
         for attr in all_attrs:
             if attr not in filtered_attrs:
                 # Eliminate all unfiltered attributes
                 setattr(new_ts, attr, None)
             else:
-                setattr(new_ts, attr, copy.deepcopy(np.asarray(getattr(self, attr))[mask]))
+                setattr(new_ts, attr, _masked_copy(getattr(self, attr), mask))
         return new_ts
 
     def _operation_with_other_obj(
@@ -777,6 +1310,9 @@ class StingrayObject(object):
         error_operation : function
             The function used for error propagation. Defaults to the sum of squares.
 
+        inplace : bool
+            If True, overwrite the current time series. Otherwise, return a new one.
+
         Returns
         -------
         ts_new : StingrayTimeseries object
@@ -809,9 +1345,9 @@ class StingrayObject(object):
             ts_new = self
         else:
             ts_new = type(self)()
-        setattr(ts_new, self.main_array_attr, this_time)
-        for attr in self.meta_attrs():
-            setattr(ts_new, attr, copy.deepcopy(getattr(self, attr)))
+            setattr(ts_new, self.main_array_attr, this_time)
+            for attr in self.meta_attrs():
+                setattr(ts_new, attr, copy.deepcopy(getattr(self, attr)))
 
         for attr in operated_attrs:
             setattr(
@@ -983,6 +1519,35 @@ class StingrayObject(object):
             inplace=True,
         )
 
+    def _clone(self, skip_attrs=None):
+        """Create a copy of the object, equivalent to ``copy.deepcopy``.
+
+        Each attribute is copied separately, with immutable values (scalars, strings)
+        shared with the original object.
+
+        Other parameters
+        ----------------
+        skip_attrs : list of str or None
+            Attributes that are not copied, but shared with the original object. They
+            are supposed to be replaced by the caller right away.
+
+        Returns
+        -------
+        new_obj : :class:`StingrayObject`
+            The new object
+        """
+        if skip_attrs is None:
+            skip_attrs = []
+
+        new_obj = copy.copy(self)
+        memo = {id(self): new_obj}
+        new_attrs = {}
+        for attr, value in self.__dict__.items():
+            if attr not in skip_attrs:
+                new_attrs[attr] = _fast_copy(value, memo)
+        new_obj.__dict__.update(new_attrs)
+        return new_obj
+
     def __neg__(self):
         """
         Implement the behavior of negation of the array attributes of a :class:`StingrayObject`
@@ -993,9 +1558,11 @@ class StingrayObject(object):
 
         """
 
-        ts_new = copy.deepcopy(self)
-        for attr in self._default_operated_attrs():
-            setattr(ts_new, attr, -np.asarray(getattr(self, attr)))
+        operated_attrs = self._default_operated_attrs()
+        # The operated attributes are not copied, as they are replaced right away
+        ts_new = self._clone(skip_attrs=operated_attrs)
+        # np.negative accepts lists as well, and writes the result in a single pass
+        ts_new._set_attrs({attr: np.negative(getattr(self, attr)) for attr in operated_attrs})
 
         return ts_new
 
@@ -1007,7 +1574,10 @@ class StingrayObject(object):
         object and returns the length of the array attributes (using the main array attribute
         as probe).
         """
-        return np.size(getattr(self, self.main_array_attr))
+        value = getattr(self, self.main_array_attr)
+        if isinstance(value, np.ndarray):
+            return value.size
+        return np.size(value)
 
     def __getitem__(self, index):
         """
@@ -1036,12 +1606,16 @@ class StingrayObject(object):
         else:
             raise IndexError("The index must be either an integer or a slice " "object !")
 
+        index = slice(start, stop, step)
+
         new_ts = type(self)()
+        # Immutable meta attributes (the vast majority) are not copied
+        memo = {}
         for attr in self.meta_attrs():
-            setattr(new_ts, attr, copy.deepcopy(getattr(self, attr)))
+            setattr(new_ts, attr, _fast_copy(getattr(self, attr), memo))
 
         for attr in self.array_attrs() + [self.main_array_attr]:
-            setattr(new_ts, attr, getattr(self, attr)[start:stop:step])
+            setattr(new_ts, attr, getattr(self, attr)[index])
 
         return new_ts
 
@@ -1125,6 +1699,10 @@ class StingrayTimeseries(StingrayObject):
 
     """
 
+    # Identifies the values of time, GTIs and dt used to calculate the mask. It is not saved
+    # or copied with the other attributes.
+    __slots__ = ("_mask_key",)
+
     main_array_attr: str = "time"
     not_array_attr: list = ["gti"]
     _time: TTime = None
@@ -1147,24 +1725,28 @@ class StingrayTimeseries(StingrayObject):
     ):
         StingrayObject.__init__(self)
 
-        self.notes = notes
-        self.mjdref = mjdref
-        self.gti = gti
-        self.ephem = ephem
-        self.timeref = timeref
-        self.timesys = timesys
-        self._mask = None
-        self.high_precision = high_precision
-        self.dt = other_kw.pop("dt", 0)
+        self._set_attrs(
+            dict(
+                notes=notes,
+                mjdref=mjdref,
+                gti=gti,
+                ephem=ephem,
+                timeref=timeref,
+                timesys=timesys,
+                _mask=None,
+                high_precision=high_precision,
+                dt=other_kw.pop("dt", 0),
+            )
+        )
 
         self._set_times(time, high_precision=high_precision)
-        for kw in other_kw:
-            setattr(self, kw, other_kw[kw])
+        new_attrs = dict(other_kw)
         for kw in array_attrs:
             new_arr = np.asarray(array_attrs[kw])
             if self.time.shape[0] != new_arr.shape[0]:
                 raise ValueError(f"Lengths of time and {kw} must be equal.")
-            setattr(self, kw, new_arr)
+            new_attrs[kw] = new_arr
+        self._set_attrs(new_attrs)
 
     @property
     def time(self):
@@ -1181,7 +1763,7 @@ class StingrayTimeseries(StingrayObject):
     @property
     def gti(self):
         if self._gti is None and self._time is not None:
-            if isinstance(self.dt, Iterable):
+            if _is_dt_array(self.dt):
                 dt0 = self.dt[0]
                 dt1 = self.dt[-1]
             else:
@@ -1200,10 +1782,13 @@ class StingrayTimeseries(StingrayObject):
 
     @property
     def mask(self):
-        from .gti import create_gti_mask
-
-        if self._mask is None:
-            self._mask = create_gti_mask(self.time, self.gti, dt=self.dt)
+        time, gti, dt = self.time, self.gti, self.dt
+        # The mask is recalculated only if any of the time, GTI or dt values changed
+        dt_key = id(dt) if isinstance(dt, np.ndarray) or _is_dt_array(dt) else dt
+        mask_key = (id(time), id(gti), dt_key)
+        if self._mask is None or getattr(self, "_mask_key", None) != mask_key:
+            self._mask = create_gti_mask(time, gti, dt=dt)
+            object.__setattr__(self, "_mask_key", mask_key)
         return self._mask
 
     @property
@@ -1211,6 +1796,7 @@ class StingrayTimeseries(StingrayObject):
         return self.main_array_length
 
     def _set_times(self, time, high_precision=False):
+        self._mask = None
         if time is None or np.size(time) == 0:
             self._time = None
             return
@@ -1256,8 +1842,11 @@ class StingrayTimeseries(StingrayObject):
         """
         if value is None:
             return None
-        value = np.asarray(value)
-        if len(value.shape) < 1:
+        # Plain arrays are by far the most common input. Subclasses (e.g. quantities)
+        # still go through np.asarray, to be converted to plain arrays.
+        if type(value) is not np.ndarray:
+            value = np.asarray(value)
+        if value.ndim < 1:
             raise ValueError(f"{attr_name} array must be at least 1D")
         # If the attribute we compare it with is the same and it is currently None, we assign it
         # This can happen, e.g. with the time array.
@@ -1291,16 +1880,19 @@ class StingrayTimeseries(StingrayObject):
             If True, overwrite the current time series. Otherwise, return a new one.
 
         """
-        # I import here to avoid the risk of circular imports
-        from .gti import check_gtis, create_gti_mask
-
         if new_gti is None:
             new_gti = self.gti
 
         check_gtis(new_gti)
 
-        # This will automatically be recreated from GTIs once I set it to None
-        good = create_gti_mask(self.time, new_gti, dt=self.dt)
+        if new_gti is self.gti:
+            # Reuse the mask, if already calculated
+            good = self.mask
+            if inplace and np.all(good):
+                # Nothing to filter out
+                return self
+        else:
+            good = create_gti_mask(self.time, new_gti, dt=self.dt)
         newts = self.apply_mask(good, inplace=inplace)
         # Important, otherwise addition/subtraction ops will go into an infinite loop
         if inplace:
@@ -1324,14 +1916,18 @@ class StingrayTimeseries(StingrayObject):
         list_of_tss : list
             A list of :class:`StingrayTimeseries` objects, one for each GTI segment
         """
-        from .gti import gti_border_bins, create_gti_mask
-
         if gti is None:
             gti = self.gti
 
         list_of_tss = []
 
-        start_bins, stop_bins = gti_border_bins(gti, self.time, self.dt)
+        time = self.time
+        start_bins, stop_bins = gti_border_bins(gti, time, self.dt)
+        # With sorted times, only the bins inside each GTI need to be masked, instead
+        # of the whole time array. The bin time is the one used for the full array.
+        is_sorted = time.size > 1 and np.all(time[1:] >= time[:-1])
+        if is_sorted:
+            mask_dt = np.median(np.diff(time))
         for i in range(len(start_bins)):
             start = start_bins[i]
             stop = stop_bins[i]
@@ -1340,10 +1936,19 @@ class StingrayTimeseries(StingrayObject):
                 continue
 
             new_gti = np.array([gti[i]])
-            mask = create_gti_mask(self.time, new_gti)
-
             # Note: GTIs are consistent with default in this case!
-            new_ts = self.apply_mask(mask)
+            if not is_sorted:
+                index = create_gti_mask(time, new_gti)
+            else:
+                lo = np.searchsorted(time, new_gti[0, 0], side="left")
+                hi = np.searchsorted(time, new_gti[0, 1], side="right")
+                index = slice(lo, hi)
+                if hi > lo:
+                    good = create_gti_mask(time[index], new_gti, dt=mask_dt)
+                    if not np.all(good):
+                        index = lo + np.flatnonzero(good)
+
+            new_ts = self.apply_mask(index)
             new_ts.gti = new_gti
 
             list_of_tss.append(new_ts)
@@ -1364,23 +1969,18 @@ class StingrayTimeseries(StingrayObject):
             and the meta attributes in the `meta` dictionary
         """
         from astropy.timeseries import TimeSeries
-        from astropy.time import TimeDelta
-        from astropy import units as u
-
-        data = {}
-        array_attrs = self.array_attrs()
 
-        for attr in array_attrs:
-            if attr == "time":
-                continue
-            data[attr] = np.asarray(getattr(self, attr))
-
-        if data == {}:
-            data = None
+        # Array attributes are already arrays, so np.asarray does not copy them
+        data = {
+            attr: np.asarray(getattr(self, attr)) for attr in self.array_attrs() if attr != "time"
+        }
 
         if self.time is not None and np.size(self.time) > 0:  # type: ignore
-            times = TimeDelta(self.time * u.s)  # type: ignore
-            ts = TimeSeries(data=data, time=times)
+            # Passing the times in seconds avoids creating an intermediate Quantity array.
+            # The format is then set to the one obtained from a Quantity
+            times = TimeDelta(self.time, format="sec")  # type: ignore
+            times.format = "jd"
+            ts = TimeSeries(data=data or None, time=times)
         else:
             ts = TimeSeries()
 
@@ -1418,14 +2018,10 @@ class StingrayTimeseries(StingrayObject):
         time, mjdref = interpret_times(time, mjdref)
         new_cls.time = np.asarray(time)  # type: ignore
 
-        array_attrs = ts.colnames
-        for key, val in ts.meta.items():
-            setattr(new_cls, key, val)
-
-        for attr in array_attrs:
-            if attr == "time":
-                continue
-            setattr(new_cls, attr, np.asarray(ts[attr]))
+        # Meta attributes first, so that columns with the same name take precedence
+        new_attrs = dict(ts.meta)
+        new_attrs.update({attr: np.asarray(ts[attr]) for attr in ts.colnames if attr != "time"})
+        new_cls._set_attrs(new_attrs)
 
         return new_cls
 
@@ -1476,11 +2072,16 @@ class StingrayTimeseries(StingrayObject):
             The new time series shifted by ``time_shift``
 
         """
+        # The time array is not shifted in place, as it can be shared with the caller or
+        # with other objects (e.g. when slicing)
+        new_time = np.asarray(self.time) + time_shift
         if inplace:
             ts = self
         else:
-            ts = copy.deepcopy(self)
-        ts.time = np.asarray(ts.time) + time_shift  # type: ignore
+            # Times and GTIs are not copied, as they are replaced right away
+            ts = self._clone(skip_attrs=["_time", "_gti"])
+        # Go through the setter anyway, to reset everything that depends on the times
+        ts.time = new_time  # type: ignore
         # Pay attention here: if the GTIs are created dynamically while we
         # access the property,
         if ts._gti is not None:
@@ -1489,7 +2090,13 @@ class StingrayTimeseries(StingrayObject):
         return ts
 
     def _operation_with_other_obj(
-        self, other, operation, operated_attrs=None, error_attrs=None, error_operation=None
+        self,
+        other,
+        operation,
+        operated_attrs=None,
+        error_attrs=None,
+        error_operation=None,
+        inplace=False,
     ):
         """
         Helper method to codify an operation of one time series with another (e.g. add, subtract).
@@ -1519,6 +2126,9 @@ class StingrayTimeseries(StingrayObject):
         error_operation : function
             The function used for error propagation. Defaults to the sum of squares.
 
+        inplace : bool
+            If True, overwrite the current time series. Otherwise, return a new one.
+
         Returns
         -------
         ts_new : StingrayTimeseries object
@@ -1529,22 +2139,31 @@ class StingrayTimeseries(StingrayObject):
             warnings.warn("MJDref is different in the two time series")
             other = other.change_mjdref(self.mjdref)
 
-        if not np.array_equal(self.gti, other.gti):
-            from .gti import cross_two_gtis
-
+        # The GTIs are often shared between objects derived from the same one, and
+        # _array_equal checks for identity first
+        if not _array_equal(self.gti, other.gti):
             warnings.warn(
                 "The good time intervals in the two time series are different. Data outside the "
                 "common GTIs will be discarded."
             )
             common_gti = cross_two_gtis(self.gti, other.gti)
-            masked_self = self.apply_gtis(common_gti)
-            masked_other = other.apply_gtis(common_gti)
+            mask = create_gti_mask(self.time, common_gti, dt=self.dt)
+            # With the same times and dt, the mask is the same for the two time series
+            if np.array_equal(self.time, other.time) and np.array_equal(self.dt, other.dt):
+                other_mask = mask
+            else:
+                other_mask = create_gti_mask(other.time, common_gti, dt=other.dt)
+            # The other time series is never modified
+            masked_self = self.apply_mask(mask, inplace=inplace)
+            masked_other = other.apply_mask(other_mask)
+            masked_self.gti = masked_other.gti = common_gti
             return masked_self._operation_with_other_obj(
                 masked_other,
                 operation,
                 operated_attrs=operated_attrs,
                 error_attrs=error_attrs,
                 error_operation=error_operation,
+                inplace=inplace,
             )
 
         return super()._operation_with_other_obj(
@@ -1553,6 +2172,7 @@ class StingrayTimeseries(StingrayObject):
             operated_attrs=operated_attrs,
             error_attrs=error_attrs,
             error_operation=error_operation,
+            inplace=inplace,
         )
 
     def __add__(self, other):
@@ -1635,7 +2255,6 @@ class StingrayTimeseries(StingrayObject):
         >>> assert np.allclose(ts[:2].counts, [11, 22])
         """
         from .utils import assign_value_if_none
-        from .gti import cross_two_gtis
 
         new_ts = super().__getitem__(index)
         step = 1
@@ -1643,7 +2262,7 @@ class StingrayTimeseries(StingrayObject):
             step = assign_value_if_none(index.step, 1)
 
         dt = self.dt
-        if np.isscalar(dt):
+        if not _is_dt_array(dt):
             delta_gti_start = delta_gti_stop = dt * 0.5
         else:
             delta_gti_start = new_ts.dt[0] * 0.5
@@ -1651,9 +2270,22 @@ class StingrayTimeseries(StingrayObject):
 
         new_gti = np.asarray([[new_ts.time[0] - delta_gti_start, new_ts.time[-1] + delta_gti_stop]])
         if step > 1 and delta_gti_start > 0:
-            new_gt1 = np.array(list(zip(new_ts.time - new_ts.dt / 2, new_ts.time + new_ts.dt / 2)))
+            half_dt = new_ts.dt * 0.5
+            new_gt1 = np.empty((new_ts.time.size, 2), dtype=np.result_type(new_ts.time, half_dt))
+            np.subtract(new_ts.time, half_dt, out=new_gt1[:, 0])
+            np.add(new_ts.time, half_dt, out=new_gt1[:, 1])
             new_gti = cross_two_gtis(new_gti, new_gt1)
-        new_gti = cross_two_gtis(self.gti, new_gti)
+
+        # In the common case of a contiguous slice inside a single GTI, the crossing
+        # would just give back the new interval
+        gti = self.gti
+        is_inside_gti = (
+            new_gti.shape[0] == 1
+            and gti.shape[0] == 1
+            and gti[0, 0] <= new_gti[0, 0] < new_gti[0, 1] <= gti[0, 1]
+        )
+        if not is_inside_gti:
+            new_gti = cross_two_gtis(gti, new_gti)
 
         new_ts.gti = new_gti
         return new_ts
@@ -1721,12 +2353,10 @@ class StingrayTimeseries(StingrayObject):
 
     def _truncate_by_index(self, start, stop):
         """Private method for truncation using index values."""
-        from .gti import cross_two_gtis
-
         new_ts = self.apply_mask(slice(start, stop))
 
         dtstart = dtstop = new_ts.dt
-        if isinstance(self.dt, Iterable):
+        if _is_dt_array(self.dt):
             dtstart = self.dt[0]
             dtstop = self.dt[-1]
 
@@ -1760,10 +2390,12 @@ class StingrayTimeseries(StingrayObject):
             if start > stop:
                 raise ValueError("start time must be less than stop time!")
 
-        if not start == 0:
+        if not start == 0 and stop is not None:
+            # Find both ends with a single call
+            start, stop = self.time.searchsorted([start, stop])
+        elif not start == 0:
             start = self.time.searchsorted(start)
-
-        if stop is not None:
+        elif stop is not None:
             stop = self.time.searchsorted(stop)
 
         return self._truncate_by_index(start, stop)
@@ -1835,8 +2467,6 @@ class StingrayTimeseries(StingrayObject):
         `ts_new` : :class:`StingrayTimeseries` object
             The resulting :class:`StingrayTimeseries` object.
         """
-        from .gti import check_separate, cross_gtis, append_gtis
-
         new_ts = type(self)()
 
         if not (
@@ -1848,7 +2478,9 @@ class StingrayTimeseries(StingrayObject):
         else:
             others = others
 
-        # First of all, check if there are empty objects
+        # First of all, check if there are empty objects. A new list is built, instead of
+        # removing elements from the list being iterated (and owned by the caller)
+        non_empty_others = []
         for obj in others:
             if not isinstance(obj, type(self)):
                 raise TypeError(
@@ -1856,7 +2488,9 @@ class StingrayTimeseries(StingrayObject):
                 )
             if getattr(obj, "time", None) is None or np.size(obj.time) == 0:
                 warnings.warn("One of the time series you are joining is empty.")
-                others.remove(obj)
+                continue
+            non_empty_others.append(obj)
+        others = non_empty_others
 
         if len(others) == 0:
             return copy.deepcopy(self)
@@ -1869,8 +2503,6 @@ class StingrayTimeseries(StingrayObject):
 
         all_objs = [self] + others
 
-        from .gti import merge_gtis
-
         # Check if none of the GTIs was already initialized.
         all_gti = [obj._gti for obj in all_objs if obj._gti is not None]
 
@@ -1882,52 +2514,80 @@ class StingrayTimeseries(StingrayObject):
 
         all_time_arrays = [obj.time for obj in all_objs if obj.time is not None]
 
-        new_ts.time = np.concatenate(all_time_arrays)
-        order = np.argsort(new_ts.time)
-        new_ts.time = new_ts.time[order]
+        new_time = np.concatenate(all_time_arrays)
+        if np.all(new_time[1:] >= new_time[:-1]):
+            # E.g. consecutive observations: no need to sort
+            order = slice(None)
+        else:
+            # The time arrays are usually sorted, and the stable sort merges the sorted
+            # runs much faster than the default quicksort can sort the whole array
+            order = np.argsort(new_time, kind="stable")
+        new_ts.time = new_time[order]
 
         new_ts.gti = new_gti
 
-        dts = list(set([getattr(obj, "dt", None) for obj in all_objs]))
-        if len(dts) != 1:
+        # Buffers for the concatenated values, reused across attributes
+        scratch = {}
+        if not isinstance(order, slice):
+            # The unsorted times are not needed anymore: recycle them as a buffer
+            scratch[(new_time.dtype, new_time.shape)] = new_time
+
+        # Compare the time resolutions directly, as array dts cannot be hashed into a set
+        dts = [getattr(obj, "dt", None) for obj in all_objs]
+        if any(_is_dt_array(dt) for dt in dts) or any(dt != dts[0] for dt in dts[1:]):
             warnings.warn("The time resolution is different. Transforming in array")
 
-            new_dt = np.concatenate([np.zeros_like(obj.time) + obj.dt for obj in all_objs])
-            new_ts.dt = new_dt[order]
+            new_ts.dt = _concatenate_in_order(
+                [
+                    np.full(obj.time.shape, obj.dt, dtype=np.result_type(obj.time, obj.dt))
+                    for obj in all_objs
+                ],
+                order,
+                scratch,
+            )
         else:
             new_ts.dt = dts[0]
 
         def _get_set_from_many_lists(lists):
             """Make a single set out of many lists."""
-            all_vals = []
-            for ls in lists:
-                all_vals += ls
-            return set(all_vals)
-
-        def _get_all_array_attrs(objs):
-            """Get all array attributes from the time series being merged. Do not include time."""
-            return _get_set_from_many_lists(
-                [obj.array_attrs() + obj.internal_array_attrs() for obj in objs]
-            )
+            return set().union(*lists)
 
-        for attr in _get_all_array_attrs(all_objs):
+        # Classify the attributes of each object only once
+        attrs_per_obj = [
+            (obj.array_attrs() + obj.internal_array_attrs(), obj.meta_attrs()) for obj in all_objs
+        ]
+
+        # All array attributes from the time series being merged. Do not include time,
+        # nor dt, which was treated above.
+        all_array_attrs = _get_set_from_many_lists([arr_attrs for arr_attrs, _ in attrs_per_obj])
+        all_array_attrs.discard("dt")
+        # NaN fillers for the objects missing some array attributes. They are only read
+        # when concatenating, so they are created once per object and shared.
+        nan_fills = {}
+        values_per_attr = {}
+        for attr in all_array_attrs:
             # if it's here, it means that it's an array attr in at least one object.
             # So, everywhere it's None, it needs to be set to 0s of the same length as time
             new_attr_values = []
-            for obj in all_objs:
-                if getattr(obj, attr, None) is None:
+            for i, obj in enumerate(all_objs):
+                values = getattr(obj, attr, None)
+                if values is None:
                     warnings.warn(
                         f"The {attr} array is empty in one of the time series being merged. "
                         "Setting it to NaN for the affected events"
                     )
-                    new_attr_values.append(np.zeros_like(obj.time) + np.nan)
-                else:
-                    new_attr_values.append(getattr(obj, attr))
-
-            new_attr = np.concatenate(new_attr_values)[order]
+                    if i not in nan_fills:
+                        nan_fills[i] = np.full_like(
+                            obj.time, np.nan, dtype=np.result_type(obj.time, np.nan)
+                        )
+                    values = nan_fills[i]
+                new_attr_values.append(values)
+            values_per_attr[attr] = new_attr_values
+
+        for attr, new_attr in _concatenate_many_in_order(values_per_attr, order, scratch).items():
             setattr(new_ts, attr, new_attr)
 
-        all_meta_attrs = _get_set_from_many_lists([obj.meta_attrs() for obj in all_objs])
+        all_meta_attrs = _get_set_from_many_lists([meta for _, meta in attrs_per_obj])
         # The attributes being treated separately are removed from the standard treatment
         # When energy, pi etc. are None, they might appear in the meta_attrs, so we
         # also add them to the list of attributes to be removed if present.
@@ -1941,14 +2601,6 @@ class StingrayTimeseries(StingrayObject):
             if attr in all_meta_attrs:
                 all_meta_attrs.remove(attr)
 
-        def _safe_concatenate(a, b):
-            if isinstance(a, str) and isinstance(b, str):
-                return a + "," + b
-            else:
-                if isinstance(a, tuple):
-                    return a + (b,)
-                return (a, b)
-
         for attr in all_meta_attrs:
             self_attr = getattr(self, attr, None)
             new_val = self_attr
@@ -1958,7 +2610,7 @@ class StingrayTimeseries(StingrayObject):
                     warnings.warn(
                         "Attribute " + attr + " is different in the time series being merged."
                     )
-                    new_val = _safe_concatenate(new_val, other_attr)
+                    new_val = _join_meta_values(new_val, other_attr)
             setattr(new_ts, attr, new_val)
 
         new_ts.mjdref = self.mjdref
@@ -2049,45 +2701,47 @@ class StingrayTimeseries(StingrayObject):
         if np.any(dt_new < np.asarray(self.dt)):
             raise ValueError("The new time resolution must be larger than the old one!")
 
-        gti_new = []
+        gti = self.gti
+        gti_new = gti[~(gti[:, 1] - gti[:, 0] < dt_new)]
+        if len(gti_new) == 0:
+            raise ValueError("No valid GTIs after rebin.")
+
+        # Find start and end of each GTI segment in the data, all in one call
+        segments = self.time.searchsorted(gti_new.reshape(-1)).reshape(-1, 2).tolist()
 
         new_ts = type(self)()
 
-        for attr in self.array_attrs() + self.internal_array_attrs():
-            bin_time, bin_counts, bin_err = [], [], []
-            if attr.endswith("_err"):
+        all_attrs = self.array_attrs() + self.internal_array_attrs()
+        err_attrs = {attr for attr in all_attrs if attr.endswith("_err")}
+        for attr in all_attrs:
+            if attr in err_attrs:
                 continue
+            values = getattr(self, attr)
+            errors = getattr(self, attr + "_err") if attr + "_err" in err_attrs else None
+            bin_time, bin_counts, bin_err = [], [], []
             e_temp = None
-            for g in self.gti:
-                if g[1] - g[0] < dt_new:
-                    continue
-                else:
-                    # find start and end of GTI segment in data
-                    start_ind = self.time.searchsorted(g[0])
-                    end_ind = self.time.searchsorted(g[1])
+            for start_ind, end_ind in segments:
+                t_temp = self.time[start_ind:end_ind]
+                c_temp = values[start_ind:end_ind]
 
-                    t_temp = self.time[start_ind:end_ind]
-                    c_temp = getattr(self, attr)[start_ind:end_ind]
+                if errors is not None:
+                    e_temp = errors[start_ind:end_ind]
 
-                    if hasattr(self, attr + "_err"):
-                        e_temp = getattr(self, attr + "_err")[start_ind:end_ind]
+                bin_t, bin_c, bin_e, _ = rebin_data(
+                    t_temp, c_temp, dt_new, yerr=e_temp, method=method, dx=self.dt
+                )
 
-                    bin_t, bin_c, bin_e, _ = rebin_data(
-                        t_temp, c_temp, dt_new, yerr=e_temp, method=method, dx=self.dt
-                    )
+                bin_time.append(bin_t)
+                bin_counts.append(bin_c)
+                bin_err.append(bin_e)
 
-                    bin_time.extend(bin_t)
-                    bin_counts.extend(bin_c)
-                    bin_err.extend(bin_e)
-                    gti_new.append(g)
+            # Join the per-GTI arrays with a single allocation per attribute
             if new_ts.time is None:
-                new_ts.time = np.array(bin_time)
-            setattr(new_ts, attr, bin_counts)
-            if e_temp is not None:
-                setattr(new_ts, attr + "_err", bin_err)
+                new_ts.time = np.concatenate(bin_time)
+            setattr(new_ts, attr, np.concatenate(bin_counts))
+            if errors is not None:
+                setattr(new_ts, attr + "_err", np.concatenate(bin_err))
 
-        if len(gti_new) == 0:
-            raise ValueError("No valid GTIs after rebin.")
         new_ts.gti = np.asarray(gti_new)
 
         for attr in self.meta_attrs():
@@ -2097,6 +2751,27 @@ class StingrayTimeseries(StingrayObject):
         new_ts.dt = dt_new
         return new_ts
 
+    def _sort_by(self, values, reverse=False, inplace=False):
+        """Reorder all array attributes so that ``values`` are sorted.
+
+        If ``values`` are already sorted, no index array is computed, and the object is
+        returned as is if ``inplace`` is True.
+
+        Parameters
+        ----------
+        values : array
+            The values to be sorted, of the same length as the time array.
+        reverse : bool
+            If True, sort in decreasing order.
+        inplace : bool
+            If True, overwrite the current object. Otherwise, return a new one.
+        """
+        order = _sort_order(values, reverse=reverse)
+        # Already sorted: nothing to do
+        if inplace and isinstance(order, slice) and order.step is None:
+            return self
+        return self.apply_mask(order, inplace=inplace)
+
     def sort(self, reverse=False, inplace=False):
         """
         Sort a ``StingrayTimeseries`` object by time.
@@ -2129,10 +2804,7 @@ class StingrayTimeseries(StingrayObject):
             arrays.
         """
 
-        mask = np.argsort(self.time)
-        if reverse:
-            mask = mask[::-1]
-        return self.apply_mask(mask, inplace=inplace)
+        return self._sort_by(self.time, reverse=reverse, inplace=inplace)
 
     def plot(
         self,
@@ -2182,7 +2854,6 @@ class StingrayTimeseries(StingrayObject):
             Plot the bad time intervals as red areas on the plot
         """
         import matplotlib.pyplot as plt
-        from .gti import get_btis
 
         if ax is None:
             plt.figure(attr)
@@ -2216,10 +2887,14 @@ class StingrayTimeseries(StingrayObject):
             else:
                 ax.figure.savefig(filename)
 
-        if plot_btis and self.gti is not None and len(self.gti) > 1:
-            tstart = min(self.time[0] - self.dt / 2, self.gti[0, 0])
-            tend = max(self.time[-1] + self.dt / 2, self.gti[-1, 1])
-            btis = get_btis(self.gti, tstart, tend)
+        gti = self.gti
+        if plot_btis and gti is not None and len(gti) > 1:
+            dt_start = dt_stop = self.dt
+            if _is_dt_array(self.dt):
+                dt_start, dt_stop = self.dt[0], self.dt[-1]
+            tstart = min(self.time[0] - dt_start / 2, gti[0, 0])
+            tend = max(self.time[-1] + dt_stop / 2, gti[-1, 1])
+            btis = get_btis(gti, tstart, tend)
             for bti in btis:
                 plt.axvspan(bti[0], bti[1], alpha=0.5, color="r", zorder=10)
         return ax
@@ -2284,6 +2959,11 @@ def interpret_times(time: TTime, mjdref: float = 0) -> tuple[npt.ArrayLike, floa
     if time is None:
         return None, mjdref
 
+    # Plain arrays are by far the most common input, so they skip all other checks.
+    # Subclasses (e.g. Quantity) are not caught here, and are treated below.
+    if type(time) is np.ndarray:
+        return time, mjdref
+
     if isinstance(time, TimeDelta):
         out_times = time.to("s").value
         return out_times, mjdref
@@ -2297,14 +2977,23 @@ def interpret_times(time: TTime, mjdref: float = 0) -> tuple[npt.ArrayLike, floa
                 else:
                     mjdref = mjds
 
-        out_times = (mjds - mjdref) * 86400
+        out_times = mjds - mjdref
+        if isinstance(out_times, np.ndarray):
+            # Avoid a second temporary for long arrays
+            out_times *= 86400
+        else:
+            out_times = out_times * 86400
         return out_times, mjdref
 
     if isinstance(time, Quantity):
         out_times = time.to("s").value
         return out_times, mjdref
 
-    if isinstance(time, (tuple, list, np.ndarray)):
+    if isinstance(time, (tuple, list)):
+        # Convert sequences once here, rather than in every caller
+        return np.asarray(time), mjdref
+
+    if isinstance(time, np.ndarray):
         return time, mjdref
 
     if not isinstance(time, Iterable):
@@ -2317,6 +3006,17 @@ def interpret_times(time: TTime, mjdref: float = 0) -> tuple[npt.ArrayLike, floa
     raise ValueError(f"Unknown time format: {type(time)}")
 
 
+@functools.lru_cache
+def _probe_dtypes(probe_types):
+    """Set of the NumPy dtypes, among the type names in ``probe_types``, defined on this platform.
+
+    Examples
+    --------
+    >>> assert _probe_dtypes(("float64", "float80")) == {np.dtype("float64")}
+    """
+    return frozenset(np.dtype(getattr(np, t)) for t in probe_types if hasattr(np, t))
+
+
 def reduce_precision_if_extended(
     x, probe_types=["float128", "float96", "float80", "longdouble"], destination=float
 ):
@@ -2358,24 +3058,12 @@ def reduce_precision_if_extended(
     False
     """
 
-    def obj2sctype(x):
-        """Convert an object to a numpy scalar type."""
-        if hasattr(np, "obj2sctype"):
-            return np.obj2sctype(x)
-
-        if isinstance(x, str):
-            return "str"
-
-        if isinstance(x, Iterable) and np.size(x) > 1:
-            return obj2sctype(x[0])
-
-        if "numpy" not in str(type(x)):
-            return "None"
-
-        return x.dtype.type
-        # return np.dtype(x).type
+    dtype = getattr(x, "dtype", None)
+    # Python scalars, strings and other non-NumPy objects are never extended precision
+    if not isinstance(dtype, np.dtype):
+        return x
 
-    if any([t in str(obj2sctype(x)) for t in probe_types]):
+    if dtype in _probe_dtypes(tuple(probe_types)):
         x_ret = x.astype(destination)
         return x_ret
     return x
@@ -512,8 +512,7 @@ class EventList(StingrayTimeseries):
         >>> assert np.allclose(events.time, [0, 1, 2])
 
         """
-        order = np.argsort(self.time)
-        return self.apply_mask(order, inplace=inplace)
+        return self._sort_by(self.time, inplace=inplace)
 
     def join(self, other, strategy="infer"):
         """
@@ -1008,17 +1008,19 @@ def merge_gtis(gti_list, strategy):
     if len(all_gti_lists) == 1:
         return all_gti_lists[0]
 
-    cross = cross_gtis(all_gti_lists)
-    if len(cross) == 0:
-        cross = None
-    if strategy == "infer":
-        if cross is None:
-            strategy = "union"
-        else:
-            strategy = "intersection"
-
-    if strategy == "intersection":
-        return cross
+    # The intersection is only needed by these strategies
+    if strategy in ("intersection", "infer"):
+        cross = cross_gtis(all_gti_lists)
+        if len(cross) == 0:
+            cross = None
+        if strategy == "infer":
+            if cross is None:
+                strategy = "union"
+            else:
+                strategy = "intersection"
+
+        if strategy == "intersection":
+            return cross
 
     gti0 = all_gti_lists[0]
     for gti in all_gti_lists[1:]:
@@ -1064,6 +1066,10 @@ def append_gtis(gti0, gti1):
     check_gtis(gti0)
     check_gtis(gti1)
 
+    # Common case of consecutive GTIs: they are mutually exclusive and already sorted
+    if gti0[-1, 1] <= gti1[0, 0]:
+        return join_equal_gti_boundaries(np.concatenate([gti0, gti1]))
+
     # Check if GTIs are mutually exclusive.
     if not check_separate(gti0, gti1):
         raise ValueError("In order to append, GTIs must be mutually exclusive.")
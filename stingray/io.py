@@ -923,6 +923,17 @@ def savefig(filename, **kwargs):
     plt.savefig(filename, **kwargs)
 
 
+# Results of the probes on the capabilities of each file format, indexed by format and
+# file extension. They do not change during a session, so they are only calculated once.
+_CAN_SAVE_LONGDOUBLE = {}
+_CAN_SERIALIZE_META = {}
+
+
+def _probe_key(probe_file: str, fmt: str) -> tuple:
+    """Key of the probe caches. If ``fmt`` is None, the format depends on the file extension."""
+    return (fmt, os.path.splitext(probe_file)[1])
+
+
 def _can_save_longdouble(probe_file: str, fmt: str) -> bool:
     """Check if a given file format can save tables with longdoubles.
 
@@ -933,6 +944,9 @@ def _can_save_longdouble(probe_file: str, fmt: str) -> bool:
 
     If no exception is raised, return True.
 
+    The result of the probe is cached for each format, while the warning is emitted at
+    every call.
+
     Parameters
     ----------
     probe_file : str
@@ -949,20 +963,26 @@ def _can_save_longdouble(probe_file: str, fmt: str) -> bool:
         # There are no known issues with saving longdoubles where numpy.float128 is not defined
         return True
 
-    try:
-        Table({"a": np.arange(0, 3, 1.212314).astype(np.float128)}).write(
-            probe_file, format=fmt, overwrite=True
-        )
-        yes_it_can = True
-        os.unlink(probe_file)
-    except ValueError as e:
-        if "float128" not in str(e):  # pragma: no cover
-            raise
+    key = _probe_key(probe_file, fmt)
+    if key not in _CAN_SAVE_LONGDOUBLE:
+        try:
+            Table({"a": np.arange(0, 3, 1.212314).astype(np.float128)}).write(
+                probe_file, format=fmt, overwrite=True
+            )
+            yes_it_can = True
+            os.unlink(probe_file)
+        except ValueError as e:
+            if "float128" not in str(e):  # pragma: no cover
+                raise
+            yes_it_can = False
+        _CAN_SAVE_LONGDOUBLE[key] = yes_it_can
+
+    yes_it_can = _CAN_SAVE_LONGDOUBLE[key]
+    if not yes_it_can:
         warnings.warn(
             f"{fmt} output does not allow saving metadata at maximum precision. "
             "Converting to lower precision"
         )
-        yes_it_can = False
     return yes_it_can
 
 
@@ -975,6 +995,9 @@ def _can_serialize_meta(probe_file: str, fmt: str) -> bool:
 
     If no exception is raised, return True.
 
+    The result of the probe is cached for each format, while the warning is emitted at
+    every call.
+
     Parameters
     ----------
     probe_file : str
@@ -987,17 +1010,23 @@ def _can_serialize_meta(probe_file: str, fmt: str) -> bool:
     yes_it_can : bool
         Whether the format can serialize the metadata
     """
-    try:
-        Table({"a": [3]}).write(probe_file, overwrite=True, format=fmt, serialize_meta=True)
-
-        os.unlink(probe_file)
-        yes_it_can = True
-    except TypeError as e:
-        if "serialize_meta" not in str(e):  # pragma: no cover
-            raise
+    key = _probe_key(probe_file, fmt)
+    if key not in _CAN_SERIALIZE_META:
+        try:
+            Table({"a": [3]}).write(probe_file, overwrite=True, format=fmt, serialize_meta=True)
+
+            os.unlink(probe_file)
+            yes_it_can = True
+        except TypeError as e:
+            if "serialize_meta" not in str(e):  # pragma: no cover
+                raise
+            yes_it_can = False
+        _CAN_SERIALIZE_META[key] = yes_it_can
+
+    yes_it_can = _CAN_SERIALIZE_META[key]
+    if not yes_it_can:
         warnings.warn(
             f"{fmt} output does not serialize the metadata at the moment. "
             "Some attributes will be lost."
         )
-        yes_it_can = False
     return yes_it_can
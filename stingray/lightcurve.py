@@ -367,6 +367,7 @@ class Lightcurve(StingrayTimeseries):
             for attr in self.internal_array_attrs():
                 setattr(self, attr, None)
         self._time = value
+        self._mask = None
         self._bin_lo = None
         self._bin_hi = None
 
@@ -581,14 +582,24 @@ class Lightcurve(StingrayTimeseries):
             warnings.warn("MJDref is different in the two light curves")
             other = other.change_mjdref(self.mjdref)
 
-        common_gti = cross_two_gtis(self.gti, other.gti)
-        if not np.array_equal(self.gti, common_gti):
-            warnings.warn(
-                "The good time intervals in the two time series are different. Data outside the "
-                "common GTIs will be discarded."
-            )
-        mask_self = create_gti_mask(self.time, common_gti, dt=self.dt)
-        mask_other = create_gti_mask(other.time, common_gti, dt=other.dt)
+        same_gti = self.gti is other.gti or (
+            self.gti.shape == other.gti.shape and np.array_equal(self.gti, other.gti)
+        )
+        # Adjacent GTIs would be joined by the crossing
+        if same_gti and not np.any(self.gti[1:, 0] == self.gti[:-1, 1]):
+            # Same GTIs (often the very same array): no need to cross them
+            common_gti = self.gti
+            mask_self = self.mask
+            mask_other = other.mask
+        else:
+            common_gti = cross_two_gtis(self.gti, other.gti)
+            if not np.array_equal(self.gti, common_gti):
+                warnings.warn(
+                    "The good time intervals in the two time series are different. Data outside "
+                    "the common GTIs will be discarded."
+                )
+            mask_self = create_gti_mask(self.time, common_gti, dt=self.dt)
+            mask_other = create_gti_mask(other.time, common_gti, dt=other.dt)
 
         # ValueError is raised by Numpy while asserting np.equal over arrays
         # with different dimensions.
@@ -1245,10 +1256,7 @@ class Lightcurve(StingrayTimeseries):
             arrays.
         """
 
-        mask = np.argsort(self.time)
-        if reverse:
-            mask = mask[::-1]
-        return self.apply_mask(mask, inplace=inplace)
+        return self._sort_by(self.time, reverse=reverse, inplace=inplace)
 
     def sort_counts(self, reverse=False, inplace=False):
         """
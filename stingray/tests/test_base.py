@@ -1,9 +1,10 @@
 import os
 import copy
+import pickle
 import pytest
 import numpy as np
 import matplotlib.pyplot as plt
-from stingray.base import StingrayObject, StingrayTimeseries
+from stingray.base import StingrayObject, StingrayTimeseries, convert_table_attrs_to_lowercase
 
 _HAS_XARRAY = _HAS_PANDAS = _HAS_H5PY = _HAS_YAML = True
 
@@ -54,6 +55,17 @@ class BadStingrayObj(StingrayObject):
         StingrayObject.__init__(self)
 
 
+@pytest.mark.parametrize("copy", [True, False])
+def test_convert_table_attrs_to_lowercase(copy):
+    from astropy.table import Table
+
+    table = Table({"TIME": np.arange(3.0), "Counts": np.ones(3)}, meta={"MJDREF": 55000})
+    new_table = convert_table_attrs_to_lowercase(table, copy=copy)
+    assert new_table.colnames == ["time", "counts"]
+    assert new_table.meta == {"mjdref": 55000}
+    assert np.shares_memory(new_table["time"], table["TIME"]) != copy
+
+
 class TestStingrayObject:
     @classmethod
     def setup_class(cls):
@@ -129,6 +141,139 @@ class TestStingrayObject:
         del ts2.blah
         assert ts1 == ts2
 
+    def test_equality_with_nans(self):
+        ts1 = copy.deepcopy(self.sting_obj)
+        ts1.pardulas = np.array([np.nan, 2.0j, 1.0 + 0.0j])
+        ts2 = copy.deepcopy(ts1)
+        assert ts1 == ts2
+        ts2.pardulas = np.array([2.0j, np.nan, 1.0 + 0.0j])
+        assert ts1 != ts2
+
+    def test_equality_float_meta(self):
+        ts1 = copy.deepcopy(self.sting_obj)
+        ts1.mjdref = 55000.5
+        ts1.tstart = np.float32(1.5)
+        ts1.tstop = np.nan
+        ts2 = copy.deepcopy(ts1)
+        assert ts1 == ts2
+        ts2.mjdref = 55000.50001
+        assert ts1 != ts2
+        ts2.mjdref = 55000.5
+        ts2.tstart = 1.5
+        assert ts1 == ts2
+        ts2.tstop = 0.0
+        assert ts1 != ts2
+
+    def test_equality_large_arrays(self):
+        ts1 = copy.deepcopy(self.sting_obj)
+        ts1.blah = np.random.uniform(0, 1, (300000, 2))
+        ts1.blah[1000] = np.nan
+        ts2 = copy.deepcopy(ts1)
+        assert ts1 == ts2
+        ts2.blah[-1, -1] = 2
+        assert ts1 != ts2
+
+    def test_different_meta_array_shapes(self):
+        ts1 = copy.deepcopy(self.sting_obj)
+        ts2 = copy.deepcopy(self.sting_obj)
+        ts2.panesapa = np.asarray(ts2.panesapa).flatten()
+        assert ts1 != ts2
+
+    def test_attr_lists_are_updated(self):
+        ts = copy.deepcopy(self.sting_obj)
+        assert "blah" not in ts.meta_attrs()
+        ts.blah = 2
+        assert "blah" in ts.meta_attrs()
+        ts.blah = ts.guefus
+        assert "blah" not in ts.meta_attrs()
+        assert "blah" in ts.array_attrs()
+        del ts.blah
+        assert "blah" not in ts.array_attrs()
+        # The cache is never copied from other objects
+        ts._attr_cache = {"array_attrs": ["bleh"]}
+        assert "bleh" not in ts.array_attrs()
+
+    def test_attr_cache_is_not_copied(self):
+        ts = copy.deepcopy(self.sting_obj)
+        ts.array_attrs()
+        assert ts._attr_cache is not None
+        assert "_attr_cache" not in ts.__dict__
+        assert getattr(copy.deepcopy(ts), "_attr_cache", None) is None
+        assert getattr(pickle.loads(pickle.dumps(ts)), "_attr_cache", None) is None
+        assert copy.deepcopy(ts) == ts
+
+    def test_zero_dimensional_meta_array(self):
+        ts = copy.deepcopy(self.sting_obj)
+        ts.blah = np.array(3.0)
+        assert "blah" in ts.meta_attrs()
+        assert "blah" not in ts.array_attrs()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            2,
+            "a",
+            None,
+            np.array(3.0),
+            np.zeros(3),
+            np.zeros(4),
+            np.zeros((3, 2)),
+            [1, 2, 3],
+            [],
+            np.array([]),
+            [[1, 2], [3, 4]],
+            print,
+        ],
+    )
+    @pytest.mark.parametrize("attr", ["blah", "_blah", "pistochedus"])
+    def test_attr_lists_after_reassignment(self, attr, value):
+        ts = copy.deepcopy(self.sting_obj)
+        ts._blah = ts.blah = np.ones(3)
+        for new_value in [value, np.ones(3), "b", value]:
+            ts.meta_attrs(), ts.array_attrs(), ts.internal_array_attrs()
+            setattr(ts, attr, new_value)
+            reference = copy.deepcopy(ts)
+            assert ts.data_attributes() == reference.data_attributes()
+            assert ts.array_attrs() == reference.array_attrs()
+            assert ts.internal_array_attrs() == reference.internal_array_attrs()
+            assert ts.meta_attrs() == reference.meta_attrs()
+
+        # The attributes deciding the classification of all others always reset it
+        for not_array_attr in [["pardulas"], ["pardulas", "sebadas"]]:
+            ts.array_attrs(), ts.meta_attrs()
+            ts.not_array_attr = not_array_attr
+            reference = copy.deepcopy(ts)
+            assert ts.array_attrs() == reference.array_attrs()
+            assert ts.meta_attrs() == reference.meta_attrs()
+
+    def test_attr_cache_kept_on_same_kind_assignment(self):
+        ts = copy.deepcopy(self.sting_obj)
+        ts.array_attrs()
+        cache = ts._attr_cache
+        ts.pardulas = np.zeros(3)
+        ts.pistochedus = 5.0
+        assert ts._attr_cache is cache
+        ts.pistochedus = np.ones(3)
+        assert ts._attr_cache is None
+
+    def test_operated_attrs_are_updated(self):
+        ts = copy.deepcopy(self.sting_obj)
+        assert "blah" not in ts._default_operated_attrs()
+        assert "blah_err" not in ts._default_error_attrs()
+        ts.blah = np.zeros(3)
+        ts.blah_err = np.zeros(3)
+        assert "blah" in ts._default_operated_attrs()
+        assert "blah_err" in ts._default_error_attrs()
+        assert "blah_err" not in ts._default_operated_attrs()
+        ts.blah = 2.0
+        assert "blah" not in ts._default_operated_attrs()
+
+    def test_attr_lists_can_be_modified_safely(self):
+        ts = copy.deepcopy(self.sting_obj)
+        attrs = ts.array_attrs()
+        attrs.append("blah")
+        assert "blah" not in ts.array_attrs()
+
     @pytest.mark.parametrize("inplace", [True, False])
     def test_apply_mask(self, inplace):
         ts = copy.deepcopy(self.sting_obj)
@@ -161,6 +306,28 @@ class TestStingrayObject:
         else:
             assert ts is not obj
 
+    @pytest.mark.parametrize("mask", [slice(0, 2), [True, True, False], [0, 1]])
+    def test_apply_mask_does_not_share_memory(self, mask):
+        ts = copy.deepcopy(self.sting_obj)
+        ts.guefus = np.asarray(ts.guefus)
+        ts.panesapa = np.asarray(ts.panesapa)
+        obj = ts.apply_mask(mask)
+        assert np.array_equal(obj.guefus, [4, 5])
+        assert not np.may_share_memory(obj.guefus, ts.guefus)
+        assert not np.may_share_memory(obj.panesapa, ts.panesapa)
+
+    @pytest.mark.parametrize("run_length", [1, 3, 100])
+    def test_apply_mask_fragmented(self, run_length):
+        guefus = np.arange(1000)
+        ts = DummyStingrayObj(guefus)
+        ts.counts = guefus * 2.0
+        mask = (guefus // run_length) % 2 == 0
+        obj = ts.apply_mask(mask)
+        assert np.array_equal(obj.guefus, guefus[mask])
+        assert np.array_equal(obj.counts, guefus[mask] * 2.0)
+        with pytest.raises(IndexError):
+            ts.apply_mask(mask[:-1])
+
     def test_operations(self):
         guefus = [5, 10, 15]
         count1 = [300, 100, 400]
@@ -179,6 +346,21 @@ class TestStingrayObject:
         assert np.allclose(lc.counts, [-300, -1100, -400])
         assert np.array_equal(lc.guefus, guefus)
 
+    def test_neg_does_not_share_data(self):
+        ts = copy.deepcopy(self.sting_obj)
+        ts.counts = np.array([1.0, 2.0, 3.0])
+        ts.counts_err = np.array([0.1, 0.2, 0.3])
+        ts.header = {"a": [1, 2]}
+        neg = -ts
+        assert np.array_equal(neg.counts, -ts.counts)
+        assert np.array_equal(neg.counts_err, ts.counts_err)
+        neg.counts_err[0] = 5
+        neg.header["a"].append(3)
+        neg.sebadas[0][0] = 10
+        assert ts.counts_err[0] == 0.1
+        assert ts.header == {"a": [1, 2]}
+        assert ts.sebadas == self.sting_obj.sebadas
+
     def test_inplace_add(self):
         guefus = [5, 10, 15]
         count1 = [300, 100, 400]
@@ -223,6 +405,28 @@ class TestStingrayObject:
         assert np.allclose(lc.counts, [900, 1300, 1200])
         assert np.array_equal(lc.guefus, guefus)
 
+    def test_inplace_add_values(self):
+        guefus = [5, 10, 15]
+        ts1 = DummyStingrayObj(guefus)
+        ts2 = DummyStingrayObj(guefus)
+        ts1.counts = np.array([300.0, 100.0, 400.0])
+        ts2.counts = np.array([600.0, 1200.0, 800.0])
+        ts1.counts_err = np.array([3.0, 5.0, 1.0])
+        ts2.counts_err = np.array([4.0, 12.0, 1.0])
+        ts1.pardulas = np.array([1, 2, 3])
+        ts2.pardulas = np.array([1, 2, 3])
+        ts1.pardulas_err = np.array([1, 2, 3])
+        ts2.pardulas_err = np.array([1, 2, 3])
+        counts = ts1.counts
+        lc = ts1 + ts2
+        ts1 += ts2
+        # The arrays of the object may be shared with the caller, and are not overwritten
+        assert np.allclose(counts, [300, 100, 400])
+        assert np.allclose(ts1.counts, [900, 1300, 1200])
+        assert np.allclose(ts1.counts_err, [5, 13, np.sqrt(2)])
+        assert np.allclose(ts1.pardulas_err, np.sqrt(2) * np.array([1, 2, 3]))
+        assert lc == ts1
+
     def test_inplace_sub_with_method(self):
         guefus = [5, 10, 15]
         count1 = [300, 100, 400]
@@ -271,6 +475,23 @@ class TestStingrayObject:
         with pytest.raises(IndexError, match="The index must be either an integer or a slice"):
             ts1[1.0]
 
+    @pytest.mark.parametrize("gti", [[[-0.5, 10.5]], [[0, 10]], [[-0.5, 4.2], [5.3, 10.5]]])
+    @pytest.mark.parametrize("index", [slice(2, 5), slice(0, 11), slice(3, 4), 0, 10])
+    def test_slice_gtis(self, gti, index):
+        from stingray.gti import cross_two_gtis
+
+        ts = StingrayTimeseries(np.arange(11), gti=gti, dt=1)
+        new_ts = ts[index]
+        time = np.atleast_1d(ts.time[index])
+        expected = cross_two_gtis(gti, [[time[0] - 0.5, time[-1] + 0.5]])
+        assert np.allclose(new_ts.gti, expected)
+
+    @pytest.mark.parametrize("dt", [1, np.ones(11)])
+    def test_slice_gtis_with_step(self, dt):
+        ts = StingrayTimeseries(np.arange(11), gti=[[-0.5, 10.5]], dt=dt)
+        new_ts = ts[1:8:3]
+        assert np.allclose(new_ts.gti, [[0.5, 1.5], [3.5, 4.5], [6.5, 7.5]])
+
     def test_side_effects(self):
         so = copy.deepcopy(self.sting_obj)
         assert np.allclose(so.guefus, [4, 5, 2])
@@ -290,6 +511,25 @@ class TestStingrayObject:
         assert so == new_so
         assert not hasattr(new_so, "stingattr")
 
+    def test_astropy_roundtrip_longdouble_meta(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.mjdref = np.longdouble("55000.000000000000012")
+        ts = so.to_astropy_table()
+        assert ts.meta["mjdref"] == so.mjdref
+        new_so = DummyStingrayObj.from_astropy_table(ts)
+        assert so == new_so
+        if _HAS_PANDAS:
+            assert DummyStingrayObj.from_pandas(so.to_pandas()) == so
+
+    def test_astropy_table_meta_types(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.pustigonus = [np.float64(3.0), np.float64(4.0)]
+        ts = so.to_astropy_table()
+        # Numpy scalars are converted to Python types, for the sake of Yaml serializers
+        assert type(ts.meta["pistochedus"]) is float
+        assert type(ts.meta["pirichitus"]) is int
+        assert np.array_equal(ts.meta["pustigonus"], [3.0, 4.0])
+
     @pytest.mark.skipif("not _HAS_XARRAY")
     def test_xarray_roundtrip(self):
         so = copy.deepcopy(self.sting_obj)
@@ -369,6 +609,41 @@ class TestStingrayObject:
 
         assert so == new_so
 
+    def test_file_roundtrip_complex_with_real_first_element(self):
+        so = copy.deepcopy(self.sting_obj)
+        so.pardulas = np.array([3.0 + 0.0j, 2.0j, 1.0 + 1.0j])
+        with pytest.warns(UserWarning, match=".* output does not serialize the metadata"):
+            so.write("dummy.ecsv", fmt="ascii.ecsv")
+        new_so = DummyStingrayObj.read("dummy.ecsv", fmt="ascii.ecsv")
+        os.unlink("dummy.ecsv")
+
+        assert np.iscomplexobj(new_so.pardulas)
+        assert so == new_so
+
+    @pytest.mark.parametrize(
+        "colnames",
+        [
+            ["pardulas.real", "pardulas.imag"],
+            ["pardulas.imag", "pardulas.real"],
+            ["pardulas", "pardulas.imag"],
+            ["pardulas.imag", "pardulas"],
+        ],
+    )
+    def test_read_complex_columns(self, colnames):
+        from astropy.table import Table
+
+        parts = {"pardulas.real": [3.0, 0.0], "pardulas.imag": [1.0, 2.0], "pardulas": [3.0, 0.0]}
+        data = {"guefus": [4, 5]}
+        data.update({col: parts[col] for col in colnames})
+        Table(data).write("dummy_complex.ecsv", format="ascii.ecsv", overwrite=True)
+        new_so = DummyStingrayObj.read("dummy_complex.ecsv", fmt="ascii.ecsv")
+        os.unlink("dummy_complex.ecsv")
+
+        assert np.iscomplexobj(new_so.pardulas)
+        assert np.array_equal(new_so.pardulas, [3.0 + 1.0j, 2.0j])
+        assert not hasattr(new_so, "pardulas.real")
+        assert not hasattr(new_so, "pardulas.imag")
+
     def test_file_roundtrip_pickle(self):
         fmt = "pickle"
         so = copy.deepcopy(self.sting_obj)
@@ -431,6 +706,31 @@ class TestStingrayTimeseries:
         assert ts is newts1
         assert ts is not newts0
 
+    @pytest.mark.parametrize("dt", [1, 1.0, np.float32(1), np.ones(10)])
+    def test_default_gti_and_slice_with_dt_types(self, dt):
+        ts = StingrayTimeseries(np.arange(10), dt=dt)
+        assert np.allclose(ts.gti, [[-0.5, 9.5]])
+        assert np.all(ts.mask)
+        assert np.allclose(ts[2:5].gti, [[1.5, 4.5]])
+
+    def test_mask_is_updated(self):
+        from stingray.gti import create_gti_mask
+
+        ts = StingrayTimeseries(np.arange(10), gti=[[-0.5, 4.5]], dt=1)
+        mask = ts.mask
+        assert np.array_equal(mask, [True] * 5 + [False] * 5)
+        assert ts.mask is mask
+        ts.time = np.arange(10) - 3.0
+        assert np.array_equal(ts.mask, create_gti_mask(ts.time, ts.gti, dt=1))
+        ts.dt = 3
+        assert np.array_equal(ts.mask, create_gti_mask(ts.time, ts.gti, dt=3))
+        assert np.count_nonzero(ts.mask) == 3
+        ts.gti = [[-10, 10]]
+        assert np.all(ts.mask)
+        new_ts = pickle.loads(pickle.dumps(ts))
+        assert np.array_equal(new_ts.mask, ts.mask)
+        assert "_mask_key" not in new_ts.data_attributes()
+
     def test_comparison(self):
         time = [5, 10, 15]
         count1 = [300, 100, 400]
@@ -503,6 +803,18 @@ class TestStingrayTimeseries:
         ts1.time = None
         assert ts1.n == 0
 
+    def test_set_attrs(self):
+        ts = StingrayTimeseries(time=[1, 2, 3], dt=1)
+        assert "blah" not in ts.meta_attrs()
+        ts._set_attrs({"gti": [[0.5, 3.5]], "blah": 3, "bleh": np.arange(3)})
+        # Properties go through their setters
+        assert "gti" not in ts.__dict__
+        assert isinstance(ts._gti, np.ndarray)
+        assert np.array_equal(ts.gti, [[0.5, 3.5]])
+        # The lists of attributes are updated
+        assert "blah" in ts.meta_attrs()
+        assert "bleh" in ts.array_attrs()
+
     def test_what_is_array_and_what_is_not(self):
         """Test that array_attrs are not confused with other attributes.
 
@@ -548,6 +860,11 @@ class TestStingrayTimeseries:
         assert np.allclose(lc.counts, [-300, -1100, -400])
         assert np.array_equal(lc.time, time)
         assert np.allclose(lc.counts_err, np.sqrt(2))
+        ts1 += ts2  # Test __iadd__
+        assert np.allclose(ts1.counts, [900, 1300, 1200])
+        assert np.allclose(ts1.counts_err, np.sqrt(2))
+        ts1 -= ts2  # Test __isub__
+        assert np.allclose(ts1.counts, count1)
 
     def test_operations_different_mjdref(self):
         time = [5, 10, 15]
@@ -587,6 +904,16 @@ class TestStingrayTimeseries:
             lc = ts1 - ts2
         assert np.allclose(lc.counts, [300, 1100, 400])
         assert np.allclose(lc.time, [10, 20, 30])
+        # The operands are left untouched
+        assert np.allclose(ts1.time, time)
+        assert np.allclose(ts2.time, time)
+        assert np.allclose(ts1.gti, gti1)
+        with pytest.warns(
+            UserWarning, match="The good time intervals in the two time series are different."
+        ):
+            ts1 -= ts2
+        assert ts1 == lc
+        assert np.allclose(ts2.time, time)
 
     def test_len(self):
         assert len(self.sting_obj) == 10
@@ -635,6 +962,31 @@ class TestStingrayTimeseries:
         assert np.allclose(so2.gti, [[-0.1, 2.1]])
         assert np.allclose(so2.mjdref, 59777.000)
 
+    @pytest.mark.parametrize("gti", [[[1.5, 5.5]], [[1.5, 3.5], [5.5, 7.5]], [[20, 30]]])
+    def test_apply_gti_matches_mask(self, gti):
+        from stingray.gti import create_gti_mask
+
+        ts = StingrayTimeseries(
+            np.arange(10.0), array_attrs=dict(counts=np.arange(10) * 2), gti=[[-0.5, 9.5]], dt=1
+        )
+        mask = create_gti_mask(ts.time, gti, dt=1)
+        new_ts = ts.apply_gtis(new_gti=np.asarray(gti), inplace=False)
+        assert np.array_equal(new_ts.time, ts.time[mask])
+        assert np.array_equal(new_ts.counts, ts.counts[mask])
+        assert not np.shares_memory(new_ts.counts, ts.counts)
+
+    def test_apply_gti_noop(self):
+        ts = StingrayTimeseries(
+            np.arange(10.0), array_attrs=dict(counts=np.arange(10) * 2), gti=[[-0.5, 9.5]], dt=1
+        )
+        counts = ts.counts
+        assert ts.apply_gtis() is ts
+        assert ts.counts is counts
+        new_ts = ts.apply_gtis(inplace=False)
+        assert new_ts is not ts
+        assert np.array_equal(new_ts.counts, counts)
+        assert not np.shares_memory(new_ts.counts, counts)
+
     def test_split_ts_by_gtis(self):
         times = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
         counts = [1, 1, 1, 1, 2, 3, 3, 2, 3, 3]
@@ -673,6 +1025,22 @@ class TestStingrayTimeseries:
         assert np.allclose(ts0.frac_exp, [1, 0.5, 1, 1])
         assert np.allclose(ts1.frac_exp, [0.5, 0.5])
 
+    def test_split_ts_by_gtis_matches_masks(self):
+        from stingray.gti import create_gti_mask
+
+        rng = np.random.default_rng(42)
+        times = np.sort(rng.uniform(0, 100, 500))
+        gti = np.asarray([[6.5, 8.5], [11.5, 34], [40.1, 40.2], [76, 84.5]])
+        ts = StingrayTimeseries(times, array_attrs=dict(counts=np.arange(500)), gti=gti, dt=0)
+        list_of_tss = ts.split_by_gti(min_points=0)
+        assert len(list_of_tss) == 4
+        for g, new_ts in zip(gti, list_of_tss):
+            mask = create_gti_mask(times, [g])
+            assert np.array_equal(new_ts.time, times[mask])
+            assert np.array_equal(new_ts.counts, ts.counts[mask])
+            assert np.array_equal(new_ts.gti, [g])
+            assert not np.shares_memory(new_ts.counts, ts.counts)
+
     def test_truncate(self):
         time = [1, 2, 3, 4, 5, 6, 7, 8, 9]
         count = [10, 20, 30, 40, 50, 60, 70, 80, 90]
@@ -826,6 +1194,34 @@ class TestStingrayTimeseries:
         assert np.allclose(lc1._bla, ybin)
         assert np.allclose(lc1.counts_err, yerr_bin)
 
+    def test_rebin_many_gtis(self):
+        time0 = np.arange(30) + 0.5
+        count0 = np.arange(30)
+        gti0 = [[0, 10], [12, 13], [14, 30]]
+        lc0 = StingrayTimeseries(
+            time0,
+            array_attrs={"counts": count0, "counts_err": np.ones(30), "_bla": count0 * 2},
+            dt=1,
+            gti=gti0,
+        )
+        lc1 = lc0.rebin(dt_new=2)
+        assert isinstance(lc1.counts, np.ndarray)
+        assert isinstance(lc1.counts_err, np.ndarray)
+        # The GTI shorter than the new bin time is skipped
+        assert np.allclose(lc1.time, np.concatenate([np.arange(5), np.arange(7, 15)]) * 2 + 1)
+        assert np.allclose(lc1.counts, lc1.time * 2 - 1)
+        assert np.allclose(lc1._bla, lc1.counts * 2)
+        assert np.allclose(lc1.counts_err, np.sqrt(2))
+
+    def test_rebin_none_err(self):
+        lc0 = StingrayTimeseries(
+            np.arange(10) + 0.5, array_attrs={"counts": np.ones(10)}, dt=1, gti=[[0, 10]]
+        )
+        lc0.counts_err = None
+        lc1 = lc0.rebin(dt_new=2)
+        assert np.allclose(lc1.counts, 2)
+        assert getattr(lc1, "counts_err", None) is None
+
     def test_rebin_no_good_gtis(self):
         time0 = [1, 2, 3, 4]
         count0 = [10, 20, 30, 40]
@@ -874,6 +1270,22 @@ class TestStingrayTimeseries:
         assert np.allclose(lc_new.time, np.array([4, 3, 2, 1]))
         assert lc_new.mjdref == mjdref
 
+    def test_sort_already_sorted(self):
+        blah = np.asarray([40, 10, 20, 5])
+        lc = StingrayTimeseries([1, 2, 2, 4], array_attrs={"blah": blah}, dt=1)
+
+        lc_new = lc.sort()
+        assert np.array_equal(lc_new.time, [1, 2, 2, 4])
+        assert np.array_equal(lc_new.blah, blah)
+        assert not np.shares_memory(lc_new.blah, lc.blah)
+
+        lc_new = lc.sort(reverse=True)
+        assert np.array_equal(lc_new.time, [4, 2, 2, 1])
+        assert np.array_equal(lc_new.blah, blah[::-1])
+
+        assert lc.sort(inplace=True) is lc
+        assert np.array_equal(lc.blah, blah)
+
     @pytest.mark.parametrize("highprec", [True, False])
     def test_astropy_roundtrip(self, highprec):
         if highprec:
@@ -884,6 +1296,14 @@ class TestStingrayTimeseries:
         new_so = StingrayTimeseries.from_astropy_table(ts)
         assert so == new_so
 
+    def test_astropy_export_does_not_copy(self):
+        so = copy.deepcopy(self.sting_obj)
+        ts = so.to_astropy_table()
+        assert np.shares_memory(ts["guefus"], so.guefus)
+        # But the round trip does
+        new_so = StingrayTimeseries.from_astropy_table(ts)
+        assert not np.shares_memory(new_so.guefus, so.guefus)
+
     @pytest.mark.parametrize("highprec", [True, False])
     def test_astropy_ts_roundtrip(self, highprec):
         if highprec:
@@ -995,6 +1415,40 @@ class TestStingrayTimeseries:
         new_so = so.shift(1)
         assert np.allclose(new_so.time - 1, self.sting_obj.time)
         assert np.allclose(new_so.gti - 1, self.sting_obj.gti)
+        # The original object is untouched
+        assert so == (self.sting_obj_highp if highprec else self.sting_obj)
+        for attr in so.array_attrs() + so.internal_array_attrs() + ["gti"]:
+            assert not np.shares_memory(getattr(so, attr), getattr(new_so, attr))
+
+    @pytest.mark.parametrize("time", [np.arange(10), np.arange(10.0)])
+    def test_shift_time_inplace(self, time):
+        ts = StingrayTimeseries(time, gti=[[-0.5, 4.5]], dt=1)
+        assert np.count_nonzero(ts.mask) == 5
+        new_ts = ts.shift(2.5, inplace=True)
+        assert new_ts is ts
+        assert np.allclose(ts.time, time + 2.5)
+        assert np.allclose(ts.gti, [[2, 7]])
+        assert np.array_equal(ts.mask, np.arange(10) < 5)
+        # The array passed by the caller is untouched
+        assert np.array_equal(time, np.arange(10))
+
+    def test_shift_slice_inplace(self):
+        ts = StingrayTimeseries(np.arange(10.0), dt=1)
+        ts[2:5].shift(100, inplace=True)
+        assert np.array_equal(ts.time, np.arange(10.0))
+
+    def test_inplace_add_slice(self):
+        counts = np.ones(6)
+        ts = StingrayTimeseries(np.arange(6.0), array_attrs={"counts": counts}, dt=1)
+        other = StingrayTimeseries(np.arange(3.0), array_attrs={"counts": np.ones(3)}, dt=1)
+        sub = ts[0:3]
+        sub += other
+        assert np.array_equal(sub.counts, [2, 2, 2])
+        # Neither the parent object nor the caller's array are modified
+        assert np.array_equal(ts.counts, np.ones(6))
+        assert np.array_equal(counts, np.ones(6))
+        ts -= ts
+        assert np.array_equal(counts, np.ones(6))
 
     @pytest.mark.parametrize("highprec", [True, False])
     def test_change_mjdref(self, highprec):
@@ -1023,6 +1477,15 @@ class TestStingrayTimeseries:
         assert plt.fignum_exists("counts")
         plt.close("all")
 
+    def test_plot_array_dt(self):
+        time0 = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        gti0 = [[0.5, 3.5], [4.5, 9.5]]
+        lc0 = StingrayTimeseries(time0, array_attrs={"counts": time0}, dt=np.ones(9), gti=gti0)
+        plt.close("all")
+        lc0.plot("counts")
+        assert plt.fignum_exists("counts")
+        plt.close("all")
+
     def test_plot_default_filename(self):
         self.sting_obj.plot("guefus", save=True)
         assert os.path.isfile("out.png")
@@ -1120,6 +1583,15 @@ class TestJoinEvents:
         ts_new = ts.join(ts_other, strategy="union")
         assert np.allclose(ts_new.time, [1, 2, 3])
 
+    def test_join_many_empty(self):
+        ts = StingrayTimeseries(time=[1, 2, 3])
+        others = [StingrayTimeseries(), StingrayTimeseries(), StingrayTimeseries(time=[4, 5])]
+        with pytest.warns(UserWarning, match="One of the time series you are joining is empty."):
+            ts_new = ts.join(others, strategy="union")
+        assert np.allclose(ts_new.time, [1, 2, 3, 4, 5])
+        # The input list is not modified
+        assert len(others) == 3
+
     def test_join_different_dt(self):
         ts = StingrayTimeseries(time=[10, 20, 30], dt=1)
         ts_other = StingrayTimeseries(time=[40, 50, 60], dt=3)
@@ -1129,6 +1601,58 @@ class TestJoinEvents:
         assert np.array_equal(ts_new.dt, [1, 1, 1, 3, 3, 3])
         assert np.allclose(ts_new.time, [10, 20, 30, 40, 50, 60])
 
+    def test_join_many_missing_attrs(self):
+        ts = StingrayTimeseries(time=[1, 2], array_attrs=dict(counts=[1, 2], bg_counts=[3, 4]))
+        ts_other = StingrayTimeseries(time=[3, 4, 5])
+        with pytest.warns(UserWarning, match="array is empty in one of the time series"):
+            ts_new = ts.join(ts_other, strategy="union")
+
+        assert np.array_equal(ts_new.counts, [1, 2, np.nan, np.nan, np.nan], equal_nan=True)
+        assert np.array_equal(ts_new.bg_counts, [3, 4, np.nan, np.nan, np.nan], equal_nan=True)
+        ts_new.counts[2:] = 0
+        assert np.all(np.isnan(ts_new.bg_counts[2:]))
+
+    def test_join_array_dt(self):
+        ts = StingrayTimeseries(time=[10, 20, 30], dt=np.array([1, 2, 1]))
+        ts_other = StingrayTimeseries(time=[15, 50], dt=0.5)
+        with pytest.warns(UserWarning, match="The time resolution is different."):
+            ts_new = ts.join(ts_other, strategy="union")
+
+        assert np.array_equal(ts_new.dt, [1, 0.5, 2, 1, 0.5])
+        assert np.allclose(ts_new.time, [10, 15, 20, 30, 50])
+
+    @pytest.mark.parametrize("other_time", [[4, 5, 6], [0.5, 2, 3.5], [1, 2, 3]])
+    def test_join_sorts_times(self, other_time):
+        ts = StingrayTimeseries(
+            time=[1, 2, 3], array_attrs=dict(counts=[1, 2, 3], bg_counts=[3, 2, 1])
+        )
+        ts_other = StingrayTimeseries(
+            time=other_time, array_attrs=dict(counts=[4, 5, 6], bg_counts=[6, 5, 4])
+        )
+        ts_new = ts.join(ts_other, strategy="none")
+        all_times = np.concatenate([ts.time, ts_other.time])
+        # Equal times keep the order of the joined time series
+        order = np.argsort(all_times, kind="stable")
+        assert np.array_equal(ts_new.time, all_times[order])
+        assert np.array_equal(ts_new.counts, np.arange(1, 7)[order])
+        assert np.array_equal(ts_new.bg_counts, np.asarray([3, 2, 1, 6, 5, 4])[order])
+        assert not np.shares_memory(ts_new.counts, ts_new.bg_counts)
+
+    @pytest.mark.parametrize("other_time", [[4, 5, 6], [0.5, 2, 3.5]])
+    def test_join_in_threads(self, other_time, monkeypatch):
+        import stingray.base
+
+        monkeypatch.setattr(stingray.base, "_MAX_CONCATENATE_THREADS", 2)
+        monkeypatch.setattr(stingray.base, "_MIN_PARALLEL_BYTES", 0)
+        attrs = {f"attr{i}": np.arange(3) * i for i in range(6)}
+        other_attrs = {f"attr{i}": np.arange(3, 6) * i for i in range(6)}
+        ts = StingrayTimeseries(time=[1, 2, 3], array_attrs=attrs)
+        ts_other = StingrayTimeseries(time=other_time, array_attrs=other_attrs)
+        ts_new = ts.join(ts_other, strategy="none")
+        order = np.argsort(np.concatenate([ts.time, ts_other.time]), kind="stable")
+        for i in range(6):
+            assert np.array_equal(getattr(ts_new, f"attr{i}"), (np.arange(6) * i)[order])
+
     def test_join_different_instr(self):
         ts = StingrayTimeseries(time=[10, 20, 30], instr="fpma")
         ts_other = StingrayTimeseries(time=[40, 50, 60], instr="fpmb")
@@ -181,3 +181,19 @@ class TestFileFormats(object):
         plt.plot([1, 2, 3])
         savefig("test.png")
         os.unlink("test.png")
+
+    def test_format_probes_are_cached(self, monkeypatch):
+        from ..io import _can_serialize_meta, _can_save_longdouble
+
+        with pytest.warns(UserWarning, match="output does not serialize the metadata"):
+            can_serialize = _can_serialize_meta("probe.bu.bu.ecsv", "ascii.ecsv")
+        can_save_longd = _can_save_longdouble("probe.bu.bu.ecsv", "ascii.ecsv")
+
+        def no_write(*args, **kwargs):
+            raise RuntimeError("The probe should not be run twice")
+
+        monkeypatch.setattr("astropy.table.Table.write", no_write)
+        # The warning is emitted again, even if the probe is not run
+        with pytest.warns(UserWarning, match="output does not serialize the metadata"):
+            assert _can_serialize_meta("probe.bu.bu.ecsv", "ascii.ecsv") == can_serialize
+        assert _can_save_longdouble("probe.bu.bu.ecsv", "ascii.ecsv") == can_save_longd
@@ -616,6 +616,14 @@ class TestLightcurve(object):
         lc = lc1 + lc2
         np.testing.assert_almost_equal(lc.gti, self.gti)
 
+    def test_add_with_shared_gtis(self):
+        lc1 = Lightcurve(self.times, self.counts, gti=self.gti)
+        lc2 = Lightcurve(self.times, self.counts)
+        lc2.gti = lc1.gti
+        lc = lc1 + lc2
+        np.testing.assert_almost_equal(lc.gti, self.gti)
+        np.testing.assert_almost_equal(lc.counts, 2 * np.asarray(self.counts))
+
     def test_add_with_different_gtis(self):
         gti = [[0.0, 3.5]]
         lc1 = Lightcurve(self.times, self.counts, gti=self.gti)
@@ -52,6 +52,16 @@ class TestRebinData(object):
         ybin_test = np.zeros_like(xbin) + self.counts * dx_new / self.dx
         assert np.allclose(ybin_test, ybin)
 
+    @pytest.mark.parametrize("dx", [1, None])
+    def test_uneven_bins_with_varying_counts(self, dx):
+        x = np.arange(10.0)
+        y = np.arange(10.0)
+        xbin, ybin, yerr, step_size = utils.rebin_data(x, y, 1.5, y, dx=dx)
+        assert np.allclose(xbin, np.arange(6) * 1.5 + 0.25)
+        assert np.allclose(ybin, [0.5, 2.5, 5, 7, 9.5, 11.5])
+        assert np.allclose(yerr, np.sqrt(ybin))
+        assert np.allclose(step_size, 1.5)
+
     def test_rebin_data_should_raise_error_when_method_is_not_allowed(self):
         dx_new = 2.0
         with pytest.raises(ValueError):
@@ -403,6 +403,34 @@ def simon(message, **kwargs):
     warnings.warn("SIMON says: {0}".format(message), **kwargs)
 
 
+def _rebin_partial_sums(y, min_inds, max_inds, prev_frac, post_inds, post_frac, has_post):
+    """Sum the values of ``y`` falling into each new bin of :func:`rebin_data`.
+
+    For each new bin, the old bins between ``min_inds`` and ``max_inds - 1`` are summed
+    whole, and the old bins straddling its lower and upper edges are added with the
+    fractions ``prev_frac`` and ``post_frac`` respectively.
+    The output has the same dtype as the elements of ``y``, and each contribution
+    is converted to it in turn, as when accumulating in an array of this dtype.
+    """
+    dtype = type(y[0])
+    starts = min_inds
+    stops = np.maximum(max_inds - 1, starts)
+
+    # The whole bins are summed with a single reduceat call, on the pairs of indices
+    # (start, stop) of all non-empty ranges. Stops can be one past the end of y.
+    sums = np.zeros(starts.size, dtype=np.sum(y[:0]).dtype)
+    nonempty = stops > starts
+    if np.any(nonempty):
+        indices = np.stack([starts[nonempty], stops[nonempty]], axis=-1).ravel()
+        padded_y = np.append(y, np.zeros(1, dtype=y.dtype))
+        sums[nonempty] = np.add.reduceat(padded_y, indices, dtype=sums.dtype)[::2]
+
+    output = sums.astype(dtype)
+    output = (output + y[min_inds - 1] * prev_frac).astype(dtype)
+    with_post = (output + y[post_inds - 1] * post_frac).astype(dtype)
+    return np.where(has_post, with_post, output)
+
+
 def rebin_data(x, y, dx_new, yerr=None, method="sum", dx=None):
     """Rebin some data to an arbitrary new data resolution. Either sum
     the data points in the new bins or average them.
@@ -487,34 +515,27 @@ def rebin_data(x, y, dx_new, yerr=None, method="sum", dx=None):
     # new regularly binned resolution
     xbin = np.arange(xedges[0], xedges[-1] + dx_new, dx_new)
 
-    output = np.zeros(xbin.shape[0] - 1, dtype=type(y[0]))
-    outputerr = np.zeros(xbin.shape[0] - 1, dtype=type(yerr[0]))
-    step_size = np.zeros(xbin.shape[0] - 1)
-
     all_x = np.searchsorted(xedges, xbin)
     min_inds = all_x[:-1]
     max_inds = all_x[1:]
     xmins = xbin[:-1]
     xmaxs = xbin[1:]
-    for i, (xmin, xmax, min_ind, max_ind) in enumerate(zip(xmins, xmaxs, min_inds, max_inds)):
-        filtered_y = y[min_ind : max_ind - 1]
-        filtered_yerr = yerr[min_ind : max_ind - 1]
-        output[i] = np.sum(filtered_y)
-        outputerr[i] = np.sum(filtered_yerr)
-        step_size[i] = max_ind - 1 - min_ind
-
-        prev_dx = xedges[min_ind] - xedges[min_ind - 1]
-        prev_frac = (xedges[min_ind] - xmin) / prev_dx
-        output[i] += y[min_ind - 1] * prev_frac
-        outputerr[i] += yerr[min_ind - 1] * prev_frac
-        step_size[i] += prev_frac
-
-        if not max_ind == xedges.size:
-            dx_post = xedges[max_ind] - xedges[max_ind - 1]
-            post_frac = (xmax - xedges[max_ind - 1]) / dx_post
-            output[i] += y[max_ind - 1] * post_frac
-            outputerr[i] += yerr[max_ind - 1] * post_frac
-            step_size[i] += post_frac
+
+    # Fractions of the old bins straddling the lower and upper edge of each new bin.
+    # The old bin after the last edge does not exist, so it does not contribute.
+    prev_dx = xedges[min_inds] - xedges[min_inds - 1]
+    prev_frac = (xedges[min_inds] - xmins) / prev_dx
+    has_post = max_inds != xedges.size
+    post_inds = np.where(has_post, max_inds, xedges.size - 1)
+    dx_post = xedges[post_inds] - xedges[post_inds - 1]
+    post_frac = np.where(has_post, (xmaxs - xedges[post_inds - 1]) / dx_post, 0)
+
+    step_size = (max_inds - 1 - min_inds) + prev_frac + post_frac
+
+    output = _rebin_partial_sums(y, min_inds, max_inds, prev_frac, post_inds, post_frac, has_post)
+    outputerr = _rebin_partial_sums(
+        yerr, min_inds, max_inds, prev_frac, post_inds, post_frac, has_post
+    )
 
     if method in ["mean", "avg", "average", "arithmetic mean"]:
         ybin = output / step_size
@@ -2257,8 +2278,17 @@ def assign_if_not_finite(value, default):
 
 
 def sqsum(array1, array2):
-    """Return the square root of the sum of the squares of two arrays."""
-    return np.sqrt(np.add(np.square(array1), np.square(array2)))
+    """Return the square root of the sum of the squares of two arrays.
+
+    Uses ``np.hypot``, which does the calculation in a single pass without
+    intermediate arrays, and avoids overflows in the squares.
+
+    Examples
+    --------
+    >>> assert np.allclose(sqsum([3, 5], [4, 12]), [5, 13])
+    >>> assert np.isclose(sqsum(3e200, 4e200), 5e200)
+    """
+    return np.hypot(array1, array2)
 
 
 @njit